@@ -23,6 +23,7 @@ COMMON_TASKS = [
     ("fantasy.tasks.deadline_reminders.schedule_deadline_reminders", "📅 Schedule Deadline Reminders"),
     ("fantasy.services.notifications._send_notification_task", "📧 Send Notification (Internal)"),
     ("fantasy.services.notifications._send_batch_for_channels", "📧 Send Batch Notification (Internal)"),
+    ("fantasy.services.notifications._plan_and_dispatch", "📧 Plan Batch Notifications (Internal)"),
 ]
 
 
@@ -26,7 +26,7 @@ from fantasy.models.stat_predictions import (
     StatPredictionCategory,
     StatPredictionDefinition,
 )
-from fantasy.services.hltv_parser import parse_tournament_metadata
+from fantasy.services.hltv_parser import parse_tournament_metadata_cached
 
 logger = logging.getLogger(__name__)
 
@@ -249,7 +249,7 @@ class TournamentWizardView:
         # Parse main URL
         try:
             html = Fetcher().fetch(url=hltv_url)
-            metadata = parse_tournament_metadata(html)
+            metadata = parse_tournament_metadata_cached(html)
             segments.append(
                 {
                     "url": hltv_url,
@@ -285,7 +285,7 @@ class TournamentWizardView:
                 continue
             try:
                 html = Fetcher().fetch(url=additional_url)
-                add_metadata = parse_tournament_metadata(html)
+                add_metadata = parse_tournament_metadata_cached(html)
                 segments.append(
                     {
                         "url": additional_url,
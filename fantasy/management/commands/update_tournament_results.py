@@ -66,6 +66,21 @@ class UpdateResult:
         return len(self.successes) + len(self.failures)
 
 
+def update_tournament_results(tournament_id, dry_run=False, force=False, verbose=False):
+    """
+    Update results and recalculate scores for a tournament's ongoing modules.
+
+    Runs the command's handle() directly, skipping call_command's command
+    lookup and argparse round-trip. Used by the scheduled Django-Q task.
+
+    Raises:
+        CommandError: If the tournament does not exist or has no HLTV URL
+    """
+    Command().handle(
+        tournament_id=tournament_id, dry_run=dry_run, force=force, verbose=verbose
+    )
+
+
 class Command(BaseCommand):
     help = """
     Update results and recalculate scores for all ongoing modules in a tournament.
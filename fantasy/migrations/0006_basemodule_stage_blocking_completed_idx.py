@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fantasy", "0005_bracketmatch_tags"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="basemodule",
+            index=models.Index(
+                fields=["stage", "blocking_advancement", "is_completed"],
+                name="fantasy_bas_stage_i_055b25_idx",
+            ),
+        ),
+    ]
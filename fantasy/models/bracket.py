@@ -2,7 +2,7 @@ from django.conf import settings
 from django.db import models
 from collections import defaultdict
 from dataclasses import asdict
-from fantasy.utils.scoring_engine import evaluate_rules
+from fantasy.utils.scoring_engine import compile_rules, evaluate_rules
 from fantasy.models.scoring import UserBracketModuleScore
 
 from .base import TimestampMixin
@@ -229,6 +229,7 @@ class Bracket(BaseModule):
         if not rules:
             return scores_by_user
 
+        rules = compile_rules(rules)
         for match_prediction in all_match_predictions:
             user = match_prediction.user_bracket.user
             match_result = results_map.get(match_prediction.match_id)
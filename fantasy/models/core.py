@@ -6,6 +6,7 @@ from django.contrib.auth.models import (
 )
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Exists, OuterRef
 from django.utils.text import slugify
 from .base import (
     PredictionOption,
@@ -19,12 +20,14 @@ from django.utils import timezone
 import logging
 from collections import defaultdict
 from dataclasses import asdict
-from fantasy.utils.scoring_engine import evaluate_rules
+from fantasy.utils.scoring_engine import compile_rules, evaluate_rules
 from polymorphic.models import PolymorphicModel
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+_FINALIZE_MODULE_FUNC = "fantasy.tasks.finalize_module"
+
 
 class UserManager(BaseUserManager):
     """Custom manager for User model"""
@@ -282,6 +285,10 @@ class BaseModule(
 
     class Meta:
         ordering = ["-start_date"]
+        indexes = [
+            # Stage advancement looks for incomplete blocking modules
+            models.Index(fields=["stage", "blocking_advancement", "is_completed"]),
+        ]
 
     def calculate_scores(self):
         if not hasattr(self, "predictions") or not hasattr(self, "results"):
@@ -289,8 +296,8 @@ class BaseModule(
                 "Subclasses of BaseModule must have 'predictions' and 'results' related fields."
             )
 
-        all_predictions = self.predictions.select_related("user").all()
-        all_results = self.results.all()
+        all_predictions = self._get_predictions_queryset()
+        all_results = self._get_results_queryset()
 
         results_map = self._get_results_map(all_results)
 
@@ -300,6 +307,7 @@ class BaseModule(
         if not rules:
             return scores_by_user
 
+        rules = compile_rules(rules)
         for prediction in all_predictions:
             result_key = self._get_prediction_key(prediction)
             result = results_map.get(result_key)
@@ -314,6 +322,12 @@ class BaseModule(
 
         return scores_by_user
 
+    def _get_predictions_queryset(self):
+        return self.predictions.select_related("user").all()
+
+    def _get_results_queryset(self):
+        return self.results.all()
+
     def _get_results_map(self, all_results):
         raise NotImplementedError(
             "Subclasses must implement _get_results_map to map results by a key."
@@ -372,6 +386,51 @@ class BaseModule(
     def get_form_template_path(self):
         raise NotImplementedError
 
+    # Fields whose saved values save() compares against to decide on
+    # rescheduling finalization and checking stage advancement
+    _TRACKED_FIELDS = ("end_date", "finalization_delay_minutes", "is_completed")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if all(
+            loaded.get(field, models.DEFERRED) is not models.DEFERRED
+            for field in cls._TRACKED_FIELDS
+        ):
+            instance._saved_state = {
+                field: loaded[field] for field in cls._TRACKED_FIELDS
+            }
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        # The snapshot may no longer match; save() falls back to a query
+        self.__dict__.pop("_saved_state", None)
+
+    def _remember_saved_state(self, update_fields=None):
+        """Snapshot the tracked fields as they now are in the database."""
+        saved = self.__dict__.get("_saved_state")
+        if update_fields is not None and saved is None:
+            # Only part of the row was written; the rest is still unknown
+            return
+        saved = dict(saved or {})
+        for field in self._TRACKED_FIELDS:
+            if update_fields is None or field in update_fields:
+                saved[field] = getattr(self, field)
+        self._saved_state = saved
+
+    def _get_saved_state(self):
+        """Tracked field values in the database, or None if the row is missing."""
+        saved = self.__dict__.get("_saved_state")
+        if saved is None:
+            saved = (
+                BaseModule.objects.filter(pk=self.pk)
+                .values(*self._TRACKED_FIELDS)
+                .first()
+            )
+        return saved
+
     def save(self, *args, **kwargs):
         if self.stage and self.tournament_id != self.stage.tournament_id:
             raise ValidationError(
@@ -393,22 +452,20 @@ class BaseModule(
         schedule_needed = False
         check_stage_completion = False
 
-        if self.pk is None:
+        old = self._get_saved_state() if self.pk is not None else None
+        if old is None:
             schedule_needed = True
         else:
-            try:
-                old = self.__class__.objects.get(pk=self.pk)
-                if (
-                    old.end_date != self.end_date
-                    or old.finalization_delay_minutes != self.finalization_delay_minutes
-                ):
-                    schedule_needed = True
-                if not old.is_completed and self.is_completed:
-                    check_stage_completion = True
-            except self.__class__.DoesNotExist:
+            if (
+                old["end_date"] != self.end_date
+                or old["finalization_delay_minutes"] != self.finalization_delay_minutes
+            ):
                 schedule_needed = True
+            if not old["is_completed"] and self.is_completed:
+                check_stage_completion = True
 
         super().save(*args, **kwargs)
+        self._remember_saved_state(kwargs.get("update_fields"))
 
         if schedule_needed and self.end_date and not self.is_completed:
             self._schedule_finalization()
@@ -438,18 +495,22 @@ class BaseModule(
             minutes=self.finalization_delay_minutes
         )
         task_name = self._get_finalization_task_name()
-        ct = ContentType.objects.get_for_model(self.__class__)
-
-        Schedule.objects.update_or_create(
-            name=task_name,
-            defaults={
-                "func": "fantasy.tasks.finalize_module",
-                "args": f"{ct.id},{self.id}",  # Pass content_type_id and object_id
-                "schedule_type": Schedule.ONCE,
-                "next_run": finalization_time,
-                "repeats": 1,
-            },
+
+        # func and args are fixed by the task name; a reschedule only moves
+        # next_run and re-arms the run that a past finalization used up.
+        updated = Schedule.objects.filter(name=task_name).update(
+            next_run=finalization_time, repeats=1
         )
+        if not updated:
+            ct = ContentType.objects.get_for_model(self.__class__)
+            Schedule.objects.create(
+                name=task_name,
+                func=_FINALIZE_MODULE_FUNC,
+                args=f"{ct.id},{self.id}",  # Pass content_type_id and object_id
+                schedule_type=Schedule.ONCE,
+                next_run=finalization_time,
+                repeats=1,
+            )
         logger.info(
             f"Scheduled finalization for {self.__class__.__name__} {self.id} at {finalization_time}"
         )
@@ -471,16 +532,20 @@ class BaseModule(
 
     def _check_stage_advancement(self):
         """Check if all blocking modules in stage are complete and trigger next stage population"""
-        if not self.stage:
+        if not self.stage_id:
             return
 
-        blocking_modules = BaseModule.objects.filter(
-            stage=self.stage, blocking_advancement=True
+        # Stage, next stage and the blocking check in one query
+        incomplete_blocking = BaseModule.objects.filter(
+            stage=OuterRef("pk"), blocking_advancement=True, is_completed=False
+        )
+        self.stage = (
+            Stage.objects.select_related("next_stage")
+            .annotate(has_incomplete_blocking=Exists(incomplete_blocking))
+            .get(pk=self.stage_id)
         )
 
-        all_completed = all(m.is_completed for m in blocking_modules)
-
-        if not all_completed:
+        if self.stage.has_incomplete_blocking:
             logger.debug(
                 f"Stage {self.stage.id} not yet complete, waiting for other modules"
             )
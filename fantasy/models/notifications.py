@@ -111,6 +111,39 @@ class UserNotificationSettings(TimestampMixin):
 
         return [pref.channel.tag for pref in prefs]
 
+    @classmethod
+    def get_enabled_channels_by_user(cls, users, notification_type):
+        """
+        Bulk variant of get_enabled_channels_for_type.
+
+        Creates missing settings rows in a single query and resolves channel
+        tags for all users at once. Returns a dict of user pk -> list of tags.
+        """
+        user_pks = [user.pk for user in users]
+        settings_by_user = {
+            s.user_id: s for s in cls.objects.filter(user_id__in=user_pks)
+        }
+
+        missing = [cls(user_id=pk) for pk in user_pks if pk not in settings_by_user]
+        if missing:
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+            settings_by_user.update({s.user_id: s for s in missing})
+
+        enabled_pks = [
+            pk for pk in user_pks if settings_by_user[pk].notifications_enabled
+        ]
+        prefs = UserNotificationPreference.objects.filter(
+            user_id__in=enabled_pks,
+            notification_type=notification_type,
+            channel__is_active=True,
+            enabled=True,
+        ).values_list("user_id", "channel__tag")
+
+        channels_by_user = {pk: [] for pk in enabled_pks}
+        for user_id, tag in prefs:
+            channels_by_user[user_id].append(tag)
+        return channels_by_user
+
     @classmethod
     def get_or_create_for_user(cls, user):
         settings, created = cls.objects.get_or_create(user=user)
@@ -5,7 +5,7 @@ from .core import BaseModule, Player, Team, User
 from dataclasses import asdict, dataclass
 from collections import defaultdict
 from fantasy.models.scoring import UserStatPredictionsModuleScore
-from fantasy.utils.scoring_engine import evaluate_rules
+from fantasy.utils.scoring_engine import compile_rules, evaluate_rules
 
 
 @dataclass
@@ -180,6 +180,8 @@ class StatPredictionsModule(BaseModule):
 
         results_map = self._get_results_map(all_results)
         scores_by_user = defaultdict(lambda: {"total_score": 0, "breakdown": []})
+        # Compiled rules keyed by scoring rule id, None for the module fallback
+        compiled_rules = {}
 
         for prediction in all_predictions:
             user = prediction.user
@@ -187,12 +189,16 @@ class StatPredictionsModule(BaseModule):
             result = results_map.get(result_key)
 
             if result:
-                if prediction.definition.scoring_rule:
-                    rules = prediction.definition.scoring_rule.scoring_config.get(
-                        "rules", []
-                    )
-                else:
-                    rules = self.scoring_config.get("rules", [])
+                rule_id = prediction.definition.scoring_rule_id
+                rules = compiled_rules.get(rule_id)
+                if rules is None:
+                    if prediction.definition.scoring_rule:
+                        rules = prediction.definition.scoring_rule.scoring_config.get(
+                            "rules", []
+                        )
+                    else:
+                        rules = self.scoring_config.get("rules", [])
+                    rules = compiled_rules[rule_id] = compile_rules(rules)
 
                 if not rules:
                     continue
@@ -301,6 +301,17 @@ class SwissModule(BaseModule):
             self.scoring_config = get_default_swiss_scoring_config()
         super().save(*args, **kwargs)
 
+    def _get_predictions_queryset(self):
+        # Scoring rules compare predicted_record.score.groups
+        return self.predictions.select_related(
+            "user", "predicted_record__score"
+        ).prefetch_related("predicted_record__score__groups")
+
+    def _get_results_queryset(self):
+        return self.results.select_related("score__score").prefetch_related(
+            "score__score__groups"
+        )
+
     def _get_results_map(self, all_results):
         return {result.team_id: result for result in all_results}
 
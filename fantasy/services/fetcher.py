@@ -6,10 +6,22 @@ Returns raw HTML for parsers to process.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from .cache import response_cache
 
 logger = logging.getLogger(__name__)
 
+# In-process memo in front of the shared response cache, so modules of the
+# same tournament finalized back to back in one worker reuse the page. It is
+# shared by every Fetcher in the process (the module singleton, thread-local
+# fetchers and ad-hoc instances alike), hence the lock.
+LOCAL_CACHE_TTL = 60
+LOCAL_CACHE_SIZE = 16
+_local_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_local_cache_lock = threading.Lock()
+
 
 class Fetcher:
     """
@@ -94,11 +106,17 @@ class Fetcher:
         cache_key_data = self._get_cache_identifier(url)
 
         if not force_refresh:
+            local_html = self._get_local(url)
+            if local_html is not None:
+                logger.debug(f"Local cache HIT for {url}")
+                return local_html
+
             cached_html = self.cache.get(
                 source="hltv", identifier=cache_key_data, module=module
             )
             if cached_html is not None:
                 logger.debug(f"Cache HIT for {url}")
+                self._set_local(url, cached_html)
                 return cached_html
 
         logger.debug(f"Cache MISS for {url}")
@@ -108,9 +126,30 @@ class Fetcher:
         self.cache.set(
             source="hltv", identifier=cache_key_data, data=html, module=module
         )
+        self._set_local(url, html)
 
         return html
 
+    def _get_local(self, url: str):
+        """Return HTML memoized in this process within LOCAL_CACHE_TTL, if any."""
+        with _local_cache_lock:
+            entry = _local_cache.get(url)
+            if entry is None:
+                return None
+            expires_at, html = entry
+            if expires_at < time.monotonic():
+                del _local_cache[url]
+                return None
+            _local_cache.move_to_end(url)
+            return html
+
+    def _set_local(self, url: str, html: str):
+        with _local_cache_lock:
+            _local_cache[url] = (time.monotonic() + LOCAL_CACHE_TTL, html)
+            _local_cache.move_to_end(url)
+            while len(_local_cache) > LOCAL_CACHE_SIZE:
+                _local_cache.popitem(last=False)
+
     def _fetch_from_source(self, url: str, timeout: int) -> str:
         """
         Fetch HTML from source using curl_cffi.
@@ -191,6 +230,8 @@ class Fetcher:
             url: URL to invalidate
         """
         cache_key_data = self._get_cache_identifier(url)
+        with _local_cache_lock:
+            _local_cache.pop(url, None)
         self.cache.invalidate(source="hltv", identifier=cache_key_data)
         logger.info(f"Invalidated cache for {url}")
 
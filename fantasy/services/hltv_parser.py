@@ -1,31 +1,116 @@
-from bs4 import BeautifulSoup
+import copy
+import hashlib
 import re
-import json
+import sys
 import html
+import orjson
+from lxml import etree, html as lxml_html
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-
-
-@dataclass
+from operator import itemgetter
+
+# Precompiled patterns for pulling HLTV ids out of hrefs
+_TEAM_ID_RE = re.compile(r"/team/(\d+)/")
+_PLAYER_ID_RE = re.compile(r"/player/(\d+)/")
+_STATS_PLAYER_RE = re.compile(r"/stats/players/(\d+)/([^?]+)")
+_EVENT_ID_RE = re.compile(r"/events/(\d+)/")
+_BEST_OF_RE = re.compile(r"bo(\d+)")
+# HLTV renders the formats table as flat header/data cell pairs; rows carrying
+# any nested markup don't match and send the page to the tree parser.
+_FORMATS_TABLE_RE = re.compile(r'<table class="formats table">(.*?)</table>', re.S)
+_FORMAT_ROW_RE = re.compile(
+    r'<th class="format-header">([^<]*)</th>\s*<td class="format-data">([^<]*)</td>'
+)
+
+# Sort key for parse_leaderboard's (hltv_id, name, value) rows
+_ROW_VALUE = itemgetter(2)
+
+# Shared read-only defaults for walking optional keys in bracket JSON
+_EMPTY_DICT: dict = {}
+_EMPTY_LIST: list = []
+
+
+def _xpath_class(name: str) -> str:
+    """XPath predicate matching a CSS class token, like the `.name` selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Precompiled XPath for the hot result parsers (parse_swiss, parse_leaderboard)
+_XP_SWISS_ROWS = etree.XPath(
+    f"//*[{_xpath_class('group')} and {_xpath_class('swiss-mode')}]"
+    f"//*[{_xpath_class('top-row')}]"
+)
+_XP_SWISS_TEAM_LINK = etree.XPath(
+    f".//*[{_xpath_class('group-name')}]//*[{_xpath_class('team')}]//a"
+)
+_XP_SWISS_RECORD = etree.XPath(
+    f".//*[{_xpath_class('points')} and {_xpath_class('cell-width-record')}]"
+)
+_XP_LEADERS = etree.XPath(f"//div[{_xpath_class('leader')}]")
+_XP_LEADER_LINK = etree.XPath(f".//span[{_xpath_class('leader-name')}]//a")
+_XP_LEADER_RATING = etree.XPath(f".//span[{_xpath_class('leader-rating')}]//span")
+
+# Precompiled XPath for parse_teams_attending, which runs on every stage population
+_XP_TEAMS_GRID = etree.XPath(
+    f"//*[{_xpath_class('teams-attending')} and {_xpath_class('grid')}]"
+)
+_XP_TEAM_BOX = etree.XPath(f".//*[{_xpath_class('team-box')}]")
+_XP_TEAM_NAME_LINK = etree.XPath(f".//*[{_xpath_class('team-name')}]//a")
+_XP_TEXT = etree.XPath(f".//*[{_xpath_class('text')}]")
+_XP_LINEUP_BOX = etree.XPath(f".//*[{_xpath_class('lineup-box')}]")
+_XP_LINEUP_PLAYER_LINK = etree.XPath(
+    f".//*[{_xpath_class('flag-align')} and {_xpath_class('player')}]"
+    "//a[contains(@href, '/player/')]"
+)
+
+# Precompiled XPath for the event page parsers, which share one tree per page
+_XP_BRACKET_JSON = etree.XPath("//*[@data-slotted-bracket-json]")
+_XP_FORMATS_TABLE = etree.XPath(
+    f"//table[{_xpath_class('formats')} and {_xpath_class('table')}]"
+)
+_XP_TR = etree.XPath(".//tr")
+_XP_FORMAT_HEADER = etree.XPath(f".//th[{_xpath_class('format-header')}]")
+_XP_FORMAT_DATA = etree.XPath(f".//td[{_xpath_class('format-data')}]")
+_XP_EVENT_TITLE = etree.XPath(f"//*[{_xpath_class('event-hub-title')}]")
+_XP_CANONICAL = etree.XPath('//link[@rel="canonical"]')
+_XP_SWISS_GROUP = etree.XPath(
+    f"//*[{_xpath_class('group')} and {_xpath_class('swiss-mode')}]"
+)
+_XP_SECTION_HEADER = etree.XPath(f"//*[{_xpath_class('section-header')}]//span")
+_XP_RELATED_EVENT_LINK = etree.XPath(f"//*[{_xpath_class('related-event')}]//a")
+_XP_EVENT_META = etree.XPath(f"//table[{_xpath_class('eventMeta')}]")
+_XP_TH = etree.XPath(".//th")
+_XP_TD_UNIX_SPAN = etree.XPath(".//td//span[@data-unix]")
+_XP_EVENTDATE = etree.XPath(f"//td[{_xpath_class('eventdate')}]")
+_XP_UNIX_SPAN = etree.XPath(".//span[@data-unix]")
+
+
+def _intern(value):
+    """Intern strings that repeat across parsed objects (names, records, slot ids)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True, frozen=True)
 class Team:
     name: str
     hltv_id: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Player:
     name: str
     hltv_id: int
     team_hltv_id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResultRow:
     team_hltv_id: int
     record: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LeaderboardEntry:
     hltv_id: int
     name: str
@@ -33,7 +118,7 @@ class LeaderboardEntry:
     position: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TournamentStage:
     """Represents a stage parsed from HLTV formats table."""
 
@@ -49,47 +134,51 @@ def parse_teams_attending(html_content: str) -> dict:
 
     Returns dict with 'teams' and 'players' lists.
     """
-    if not html_content:
+    if not html_content or "teams-attending" not in html_content:
         return {"teams": [], "players": []}
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    return _parse_teams_attending_tree(lxml_html.fromstring(html_content))
 
+
+def _parse_teams_attending_tree(tree) -> dict:
+    """Extract attending teams and lineups from an already-parsed lxml tree."""
     teams = []
     players = []
 
     # Find teams attending grid
-    teams_grid = soup.select_one(".teams-attending.grid")
+    teams_grid = _XP_TEAMS_GRID(tree)
     if not teams_grid:
         return {"teams": [], "players": []}
 
-    for team_box in teams_grid.select(".team-box"):
-        team_link = team_box.select_one(".team-name a")
-        if not team_link:
+    for team_box in _XP_TEAM_BOX(teams_grid[0]):
+        team_links = _XP_TEAM_NAME_LINK(team_box)
+        if not team_links:
             continue
+        team_link = team_links[0]
 
         href = team_link.get("href", "")
-        team_match = re.search(r"/team/(\d+)/", href)
+        team_match = _TEAM_ID_RE.search(href)
         if not team_match:
             continue
 
         team_hltv_id = int(team_match.group(1))
 
-        team_name_el = team_link.select_one(".text")
-        team_name = team_name_el.text.strip() if team_name_el else ""
+        team_name_els = _XP_TEXT(team_link)
+        team_name = (
+            _intern(team_name_els[0].text_content().strip()) if team_name_els else ""
+        )
 
         if not team_name:
             continue
 
         teams.append(Team(name=team_name, hltv_id=team_hltv_id))
 
-        lineup_box = team_box.select_one(".lineup-box")
-        if lineup_box:
-            for player_el in lineup_box.select(
-                ".flag-align.player a[href*='/player/']"
-            ):
-                player_name = player_el.text.strip()
+        lineup_boxes = _XP_LINEUP_BOX(team_box)
+        if lineup_boxes:
+            for player_el in _XP_LINEUP_PLAYER_LINK(lineup_boxes[0]):
+                player_name = player_el.text_content().strip()
                 player_href = player_el.get("href", "")
-                player_match = re.search(r"/player/(\d+)/", player_href)
+                player_match = _PLAYER_ID_RE.search(player_href)
                 if player_match:
                     player_hltv_id = int(player_match.group(1))
                     players.append(
@@ -112,23 +201,22 @@ def parse_swiss(html_content: str) -> list[ResultRow]:
 
     Returns list of ResultRow with team records.
     """
-    if not html_content:
+    if not html_content or "swiss-mode" not in html_content:
         return []
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = lxml_html.fromstring(html_content)
 
     results = []
-    top_rows = soup.select(".group.swiss-mode .top-row")
-    for row in top_rows:
-        team_link = row.select_one(".group-name .team a")
-        if team_link:
-            href = team_link.get("href", "")
-            match = re.search(r"/team/(\d+)/", href)
+    for row in _XP_SWISS_ROWS(tree):
+        team_links = _XP_SWISS_TEAM_LINK(row)
+        if team_links:
+            href = team_links[0].get("href", "")
+            match = _TEAM_ID_RE.search(href)
             if match:
                 team_hltv_id = int(match.group(1))
-                record_element = row.select_one(".points.cell-width-record")
-                if record_element:
-                    record = record_element.text.strip()
+                record_elements = _XP_SWISS_RECORD(row)
+                if record_elements:
+                    record = _intern(record_elements[0].text_content().strip())
                     results.append(ResultRow(team_hltv_id=team_hltv_id, record=record))
 
     return results
@@ -141,65 +229,65 @@ def parse_leaderboard(html_content: str) -> list[LeaderboardEntry]:
     Returns list of LeaderboardEntry with hltv_id, name, value, position.
     Ties result in shared positions (e.g., two 1st places, then 3rd).
     """
-    if not html_content:
+    if not html_content or "leader-name" not in html_content:
         return []
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = lxml_html.fromstring(html_content)
 
-    entries = []
-    leader_divs = soup.select("div.leader")
+    rows = []
 
-    for div in leader_divs:
-        player_link = div.select_one("span.leader-name a")
-        if not player_link:
+    for div in _XP_LEADERS(tree):
+        player_links = _XP_LEADER_LINK(div)
+        if not player_links:
             continue
+        player_link = player_links[0]
 
         href = player_link.get("href", "")
-        match = re.search(r"/stats/players/(\d+)/([^?]+)", href)
+        match = _STATS_PLAYER_RE.search(href)
         if not match:
             continue
 
         hltv_id = int(match.group(1))
-        name = player_link.text.strip()
+        name = player_link.text_content().strip()
 
-        rating_span = div.select_one("span.leader-rating span")
-        if not rating_span:
+        rating_spans = _XP_LEADER_RATING(div)
+        if not rating_spans:
             continue
+        rating_text = rating_spans[0].text_content().strip()
 
         try:
-            text = rating_span.text.strip().replace("%", "")
-            value = float(text)
+            value = float(rating_text.replace("%", ""))
         except ValueError:
-            value = rating_span.text.strip()
+            value = rating_text
 
-        entries.append({"hltv_id": hltv_id, "name": name, "value": value})
+        rows.append((hltv_id, name, value))
 
     # Can't soret by value as it's not known if bigger is better
     # They should be sorted by default anyways
-    entries.sort(key=lambda x: x["value"], reverse=True)
+    rows.sort(key=_ROW_VALUE, reverse=True)
 
     result = []
     current_rank = 1
     previous_value = None
 
-    for i, entry in enumerate(entries):
-        if previous_value is not None and entry["value"] < previous_value:
+    for hltv_id, name, value in rows:
+        if previous_value is not None and value < previous_value:
             current_rank += 1
 
         result.append(
             LeaderboardEntry(
-                hltv_id=entry["hltv_id"],
-                name=entry["name"],
-                value=entry["value"],
+                hltv_id=hltv_id,
+                name=name,
+                value=value,
                 position=current_rank,
             )
         )
-        previous_value = entry["value"]
+        previous_value = value
 
     return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TournamentMetadata:
     name: str
     hltv_id: int | None
@@ -212,7 +300,7 @@ class TournamentMetadata:
     related_events: list
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BracketMatchResult:
     hltv_match_id: int
     slot_id: str
@@ -224,7 +312,7 @@ class BracketMatchResult:
     best_of: int = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedBracket:
     name: str
     bracket_type: str
@@ -237,78 +325,39 @@ def parse_brackets(html_content: str) -> list[ParsedBracket]:
 
     Returns list of ParsedBracket containing match results.
     """
-    if not html_content:
+    if not html_content or "data-slotted-bracket-json" not in html_content:
         return []
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    return _parse_brackets_tree(lxml_html.fromstring(html_content))
+
+
+def _parse_brackets_tree(tree) -> list[ParsedBracket]:
+    """Extract bracket data from an already-parsed lxml tree."""
     brackets = []
 
-    for el in soup.select("[data-slotted-bracket-json]"):
-        json_str = html.unescape(el.get("data-slotted-bracket-json", ""))
+    for el in _XP_BRACKET_JSON(tree):
+        json_str = el.get("data-slotted-bracket-json", "")
         if not json_str:
             continue
+        # lxml already decodes attribute entities; only fall back to
+        # a full unescape when something still looks escaped.
+        if "&" in json_str:
+            json_str = html.unescape(json_str)
 
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
+            data = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
             continue
 
-        bracket_name = data.get("name", "")
-        bracket_type = data.get("type", "").split(".")[-1]
+        bracket_name = _intern(data.get("name", ""))
+        bracket_type = _intern(data.get("type", "").split(".")[-1])
         matches = []
 
-        for round_data in data.get("rounds", []):
-            for slot in round_data.get("slots", []):
-                slot_id = slot.get("slotId", {}).get("id", "")
-                matchup = slot.get("matchup", {})
-
-                if not matchup:
-                    continue
-
-                match_info = matchup.get("match", {})
-                if not match_info:
-                    continue
-
-                hltv_match_id = match_info.get("matchId")
-                if not hltv_match_id:
-                    continue
-
-                team1_slot = matchup.get("team1", {})
-                team2_slot = matchup.get("team2", {})
-
-                team1_info = team1_slot.get("team")
-                team2_info = team2_slot.get("team")
-
-                team_a_hltv_id = team1_info.get("id") if team1_info else None
-                team_b_hltv_id = team2_info.get("id") if team2_info else None
-
-                # Include all matches, even those without teams (future rounds)
-                result = matchup.get("result", {}) or {}
-                match_score = result.get("matchScore", {})
-                team_a_score = match_score.get("team1Score", 0)
-                team_b_score = match_score.get("team2Score", 0)
-
-                winner_hltv_id = None
-                if match_score.get("team1Winner") and team_a_hltv_id:
-                    winner_hltv_id = team_a_hltv_id
-                elif match_score.get("team2Winner") and team_b_hltv_id:
-                    winner_hltv_id = team_b_hltv_id
-
-                # Extract best_of from numberOfMaps
-                best_of = match_info.get("numberOfMaps", 3)
-
-                matches.append(
-                    BracketMatchResult(
-                        hltv_match_id=hltv_match_id,
-                        slot_id=slot_id,
-                        team_a_hltv_id=team_a_hltv_id,
-                        team_b_hltv_id=team_b_hltv_id,
-                        team_a_score=team_a_score,
-                        team_b_score=team_b_score,
-                        winner_hltv_id=winner_hltv_id,
-                        best_of=best_of,
-                    )
-                )
+        for round_data in data.get("rounds") or _EMPTY_LIST:
+            for slot in round_data.get("slots") or _EMPTY_LIST:
+                match = _extract_match(slot)
+                if match is not None:
+                    matches.append(match)
 
         if matches:
             brackets.append(
@@ -322,83 +371,154 @@ def parse_brackets(html_content: str) -> list[ParsedBracket]:
     return brackets
 
 
+def _extract_match(slot: dict) -> BracketMatchResult | None:
+    """
+    Build a BracketMatchResult from one bracket slot.
+
+    Returns None for slots without a matchup or HLTV match id. Matches without
+    teams (future rounds) are still included.
+    """
+    matchup = slot.get("matchup")
+    if not matchup:
+        return None
+
+    match_info = matchup.get("match")
+    if not match_info:
+        return None
+
+    hltv_match_id = match_info.get("matchId")
+    if not hltv_match_id:
+        return None
+
+    team1_info = (matchup.get("team1") or _EMPTY_DICT).get("team")
+    team2_info = (matchup.get("team2") or _EMPTY_DICT).get("team")
+    team_a_hltv_id = team1_info.get("id") if team1_info else None
+    team_b_hltv_id = team2_info.get("id") if team2_info else None
+
+    result = matchup.get("result") or _EMPTY_DICT
+    match_score = result.get("matchScore") or _EMPTY_DICT
+
+    winner_hltv_id = None
+    if match_score.get("team1Winner") and team_a_hltv_id:
+        winner_hltv_id = team_a_hltv_id
+    elif match_score.get("team2Winner") and team_b_hltv_id:
+        winner_hltv_id = team_b_hltv_id
+
+    return BracketMatchResult(
+        hltv_match_id=hltv_match_id,
+        slot_id=_intern((slot.get("slotId") or _EMPTY_DICT).get("id", "")),
+        team_a_hltv_id=team_a_hltv_id,
+        team_b_hltv_id=team_b_hltv_id,
+        team_a_score=match_score.get("team1Score", 0),
+        team_b_score=match_score.get("team2Score", 0),
+        winner_hltv_id=winner_hltv_id,
+        # best_of comes from numberOfMaps
+        best_of=match_info.get("numberOfMaps", 3),
+    )
+
+
 def parse_tournament_formats(html_content: str) -> list[TournamentStage]:
     """
     Parse HLTV formats table to extract tournament stages.
 
     Returns list of TournamentStage with format type and best_of detected.
+    The plain table HLTV serves is read with a regex; anything else falls
+    back to a full tree parse.
     """
-    if not html_content:
+    if not html_content or "formats" not in html_content:
         return []
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    table = _FORMATS_TABLE_RE.search(html_content)
+    if table:
+        rows = _FORMAT_ROW_RE.findall(table.group(1))
+        if rows and len(rows) == table.group(1).count("<tr"):
+            return [
+                _build_tournament_stage(
+                    html.unescape(stage_name).strip(), html.unescape(format_text).strip()
+                )
+                for stage_name, format_text in rows
+            ]
+
+    return _parse_tournament_formats_tree(lxml_html.fromstring(html_content))
+
+
+def _parse_tournament_formats_tree(tree) -> list[TournamentStage]:
+    """Extract tournament stages from an already-parsed lxml tree."""
     stages = []
 
     # Find the formats table
-    formats_table = soup.select_one("table.formats.table")
-    if not formats_table:
+    formats_tables = _XP_FORMATS_TABLE(tree)
+    if not formats_tables:
         return []
 
-    for row in formats_table.select("tr"):
-        header = row.select_one("th.format-header")
-        data = row.select_one("td.format-data")
+    for row in _XP_TR(formats_tables[0]):
+        headers = _XP_FORMAT_HEADER(row)
+        data = _XP_FORMAT_DATA(row)
 
-        if not header or not data:
+        if not headers or not data:
             continue
 
-        stage_name = header.text.strip()
-        format_text = data.text.strip()
-
-        format_lower = format_text.lower()
-        if "swiss" in format_lower:
-            format_type = "swiss"
-        elif any(kw in format_lower for kw in ["elimination", "gsl", "bracket"]):
-            format_type = "bracket"
-        else:
-            format_type = "bracket"
-
-        best_of = 3
-        bo_match = re.search(r"bo(\d+)", format_lower)
-        if bo_match:
-            best_of = int(bo_match.group(1))
-
         stages.append(
-            TournamentStage(
-                name=stage_name,
-                format_type=format_type,
-                best_of=best_of,
-                details=format_text,
+            _build_tournament_stage(
+                headers[0].text_content().strip(), data[0].text_content().strip()
             )
         )
 
     return stages
 
 
+def _build_tournament_stage(stage_name: str, format_text: str) -> TournamentStage:
+    """Detect format type and best_of from a formats table row."""
+    format_lower = format_text.lower()
+    if "swiss" in format_lower:
+        format_type = "swiss"
+    elif any(kw in format_lower for kw in ["elimination", "gsl", "bracket"]):
+        format_type = "bracket"
+    else:
+        format_type = "bracket"
+
+    best_of = 3
+    bo_match = _BEST_OF_RE.search(format_lower)
+    if bo_match:
+        best_of = int(bo_match.group(1))
+
+    return TournamentStage(
+        name=_intern(stage_name),
+        format_type=format_type,
+        best_of=best_of,
+        details=format_text,
+    )
+
+
 def parse_tournament_metadata(html_content: str) -> dict:
     """
     Parse HLTV event page to extract tournament metadata.
 
     Returns dict with tournament info for wizard.
+    Pages without any event markers are treated as empty without building a tree.
+    The page is parsed once and every section is read from the same tree.
     """
-    if not html_content:
+    if not html_content or (
+        "event-hub-title" not in html_content and "eventMeta" not in html_content
+    ):
         return {}
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = lxml_html.fromstring(html_content)
 
-    name_el = soup.select_one(".event-hub-title")
-    name = name_el.text.strip() if name_el else ""
+    name_els = _XP_EVENT_TITLE(tree)
+    name = name_els[0].text_content().strip() if name_els else ""
 
     hltv_id = None
-    canonical = soup.select_one('link[rel="canonical"]')
-    if canonical:
-        href = canonical.get("href", "")
-        match = re.search(r"/events/(\d+)/", href)
+    canonicals = _XP_CANONICAL(tree)
+    if canonicals:
+        href = canonicals[0].get("href", "")
+        match = _EVENT_ID_RE.search(href)
         if match:
             hltv_id = int(match.group(1))
 
     teams = []
     players = []
-    parsed_attending = parse_teams_attending(html_content)
+    parsed_attending = _parse_teams_attending_tree(tree)
     if parsed_attending.get("teams"):
         teams = [
             {"hltv_id": t.hltv_id, "name": t.name} for t in parsed_attending["teams"]
@@ -409,16 +529,16 @@ def parse_tournament_metadata(html_content: str) -> dict:
             for p in parsed_attending["players"]
         ]
 
-    stages = parse_tournament_formats(html_content)
-    brackets = parse_brackets(html_content)
-    has_swiss = bool(soup.select(".group.swiss-mode"))
-    has_bracket = bool(soup.select("[data-slotted-bracket-json]"))
+    stages = _parse_tournament_formats_tree(tree)
+    brackets = _parse_brackets_tree(tree)
+    has_swiss = bool(_XP_SWISS_GROUP(tree))
+    has_bracket = bool(_XP_BRACKET_JSON(tree))
 
     if stages:
         stage_count = len(stages)
     else:
-        sections = soup.select(".section-header span")
-        section_names = [s.text.strip().lower() for s in sections]
+        sections = _XP_SECTION_HEADER(tree)
+        section_names = [s.text_content().strip().lower() for s in sections]
 
         stage_count = 0
         if "group play" in section_names or has_swiss:
@@ -429,10 +549,10 @@ def parse_tournament_metadata(html_content: str) -> dict:
             stage_count = 2
 
     related_events = []
-    for rel in soup.select(".related-event a"):
+    for rel in _XP_RELATED_EVENT_LINK(tree):
         href = rel.get("href", "")
-        rel_name = rel.text.strip()
-        match = re.search(r"/events/(\d+)/", href)
+        rel_name = rel.text_content().strip()
+        match = _EVENT_ID_RE.search(href)
         if match:
             related_events.append(
                 {
@@ -447,35 +567,35 @@ def parse_tournament_metadata(html_content: str) -> dict:
     start_date = None
     end_date = None
 
-    event_meta = soup.select_one("table.eventMeta")
-    if event_meta:
-        for row in event_meta.select("tr"):
-            header = row.select_one("th")
-            if not header:
+    event_metas = _XP_EVENT_META(tree)
+    if event_metas:
+        for row in _XP_TR(event_metas[0]):
+            headers = _XP_TH(row)
+            if not headers:
                 continue
-            header_text = header.text.strip().lower()
+            header_text = headers[0].text_content().strip().lower()
 
             if "start date" in header_text:
-                span = row.select_one("td span[data-unix]")
-                if span:
-                    unix_ms = span.get("data-unix")
+                spans = _XP_TD_UNIX_SPAN(row)
+                if spans:
+                    unix_ms = spans[0].get("data-unix")
                     if unix_ms:
                         start_date = datetime.fromtimestamp(
                             int(unix_ms) / 1000, tz=timezone.utc
                         )
             elif "end date" in header_text:
-                span = row.select_one("td span[data-unix]")
-                if span:
-                    unix_ms = span.get("data-unix")
+                spans = _XP_TD_UNIX_SPAN(row)
+                if spans:
+                    unix_ms = spans[0].get("data-unix")
                     if unix_ms:
                         end_date = datetime.fromtimestamp(
                             int(unix_ms) / 1000, tz=timezone.utc
                         )
 
     if not start_date or not end_date:
-        eventdate = soup.select_one("td.eventdate")
-        if eventdate:
-            date_spans = eventdate.select("span[data-unix]")
+        eventdates = _XP_EVENTDATE(tree)
+        if eventdates:
+            date_spans = _XP_UNIX_SPAN(eventdates[0])
             if len(date_spans) >= 1 and not start_date:
                 unix_ms = date_spans[0].get("data-unix")
                 if unix_ms:
@@ -503,3 +623,37 @@ def parse_tournament_metadata(html_content: str) -> dict:
         "stage_count": stage_count,
         "related_events": related_events,
     }
+
+
+# Parsed metadata keyed by a digest of the page HTML (most recent last)
+_METADATA_CACHE_SIZE = 64
+_metadata_cache: OrderedDict[bytes, dict] = OrderedDict()
+
+
+def _content_digest(html_content: str) -> bytes:
+    return hashlib.blake2b(html_content.encode(), digest_size=16).digest()
+
+
+def _cache_metadata(digest: bytes, metadata: dict) -> None:
+    _metadata_cache[digest] = metadata
+    _metadata_cache.move_to_end(digest)
+    while len(_metadata_cache) > _METADATA_CACHE_SIZE:
+        _metadata_cache.popitem(last=False)
+
+
+def parse_tournament_metadata_cached(html_content: str) -> dict:
+    """
+    parse_tournament_metadata memoized on a digest of the HTML.
+
+    Returns a deep copy so callers may mutate the result without touching
+    the cached entry.
+    """
+    if not html_content:
+        return parse_tournament_metadata(html_content)
+
+    digest = _content_digest(html_content)
+    metadata = _metadata_cache.get(digest)
+    if metadata is None:
+        metadata = parse_tournament_metadata(html_content)
+    _cache_metadata(digest, metadata)
+    return copy.deepcopy(metadata)
@@ -1,8 +1,17 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 from collections import defaultdict
 from decouple import config
+from urllib3.util.retry import Retry
+
+from fantasy.models import (
+    NotificationLog,
+    NotificationType,
+    User,
+    UserNotificationSettings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +21,23 @@ class NotificationService:
         self.enabled = config('APPRISE_ENABLED', default=True, cast=bool)
         self.api_url = config('APPRISE_API_URL', default='http://localhost:8228')
         self.config_key = config('APPRISE_CONFIG_KEY', default='')
+        self._session = None
+
+    @property
+    def session(self):
+        """Lazy-load a pooled requests session so Apprise calls reuse connections"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            self._session = session
+        return self._session
 
     def send_to_user(
         self,
@@ -27,8 +53,6 @@ class NotificationService:
             return {"status": "disabled", "message": "Notifications are disabled"}
 
         try:
-            from fantasy.models import NotificationType, UserNotificationSettings
-
             if isinstance(notification_type, str):
                 try:
                     notification_type_obj = NotificationType.objects.get(
@@ -86,55 +110,74 @@ class NotificationService:
         title: str,
         message: str
     ) -> Dict[str, Any]:
-        """Send notification to all active users, batched by channel combination."""
-        try:
-            from fantasy.models import User, NotificationType, UserNotificationSettings
+        """
+        Send notification to all active users, batched by channel combination.
 
+        Grouping recipients by channel is done by a planner task so callers
+        only pay for the notification type lookup and an existence check.
+        """
+        try:
             notification_type_obj = NotificationType.objects.get(
                 tag=notification_type,
                 is_active=True
             )
 
-            if notification_type_obj.is_admin_only:
-                users = User.objects.filter(is_active=True, is_superuser=True)
-            else:
-                users = User.objects.filter(is_active=True)
-
-            users_by_channels = defaultdict(list)
-
-            for user in users:
-                settings = UserNotificationSettings.objects.get_or_create(user=user)[0]
-                tags = tuple(sorted(settings.get_enabled_channels_for_type(notification_type_obj)))
-                if tags:
-                    users_by_channels[tags].append(user.uuid)
-
-            if not users_by_channels:
-                logger.info(f"No users have enabled channels for {notification_type}")
-                return {"status": "success", "message": "No users with enabled channels"}
+            if not self._get_recipients(notification_type_obj).exists():
+                logger.info(f"No recipients for {notification_type}")
+                return {"status": "success", "message": "No recipients"}
 
             from django_q.tasks import async_task
 
-            task_ids = []
-            for tags, user_uuids in users_by_channels.items():
-                task_id = async_task(
-                    "fantasy.services.notifications._send_batch_for_channels",
-                    notification_type_obj.id,
-                    title,
-                    message,
-                    list(tags),
-                    user_uuids
-                )
-                task_ids.append(task_id)
-
-            return {
-                "status": "queued",
-                "batch_count": len(task_ids),
-                "task_ids": task_ids
-            }
+            task_id = async_task(
+                "fantasy.services.notifications._plan_and_dispatch",
+                notification_type_obj.id,
+                title,
+                message
+            )
+            return {"status": "queued_planner", "task_id": task_id}
         except Exception as e:
             logger.warning(f"Failed to queue batch notification '{title}': {e}")
             return {"status": "error", "message": str(e)}
 
+    def _get_recipients(self, notification_type_obj):
+        """Active users eligible for a notification type."""
+        if notification_type_obj.is_admin_only:
+            return User.objects.filter(is_active=True, is_superuser=True)
+        return User.objects.filter(is_active=True)
+
+    def _group_users_by_channels(self, notification_type_obj, chunk_size=500):
+        """
+        Group recipient UUIDs by their sorted tuple of enabled channel tags.
+
+        Users are streamed in chunks so large user tables are never fully
+        loaded into memory.
+        """
+        users_by_channels = defaultdict(list)
+        users = self._get_recipients(notification_type_obj).only("uuid")
+
+        chunk = []
+        for user in users.iterator(chunk_size=chunk_size):
+            chunk.append(user)
+            if len(chunk) >= chunk_size:
+                self._add_chunk_channels(
+                    users_by_channels, chunk, notification_type_obj
+                )
+                chunk = []
+        if chunk:
+            self._add_chunk_channels(users_by_channels, chunk, notification_type_obj)
+
+        return users_by_channels
+
+    def _add_chunk_channels(self, users_by_channels, users, notification_type_obj):
+        """Resolve channels for one chunk of users and add them to the grouping."""
+        channels_by_user = UserNotificationSettings.get_enabled_channels_by_user(
+            users, notification_type_obj
+        )
+        for user_uuid, channel_tags in channels_by_user.items():
+            tags = tuple(sorted(channel_tags))
+            if tags:
+                users_by_channels[tags].append(user_uuid)
+
     def _send_internal(
         self,
         notification_type_obj,
@@ -190,7 +233,7 @@ class NotificationService:
     def _send_to_apprise_api(self, title: str, message: str, tags: list) -> bool:
         """Send notification to Apprise API using stateful endpoint."""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/notify/{self.config_key}",
                 json={
                     "title": title,
@@ -223,7 +266,6 @@ class NotificationService:
     ):
         """Log notification to database."""
         try:
-            from fantasy.models import NotificationLog
             NotificationLog.objects.create(
                 notification_type=notification_type,
                 recipient_type=recipient_type,
@@ -243,8 +285,6 @@ notification_service = NotificationService()
 
 def _send_notification_task(notification_type_id, title, message, tags, user_uuid=None):
     """Django-Q task for sending notifications asynchronously."""
-    from fantasy.models import NotificationType, User
-
     try:
         notification_type_obj = NotificationType.objects.get(id=notification_type_id)
         user = User.objects.get(uuid=user_uuid) if user_uuid else None
@@ -263,30 +303,78 @@ def _send_notification_task(notification_type_id, title, message, tags, user_uui
 
 def _send_batch_for_channels(notification_type_id, title, message, tags, user_uuids):
     """Django-Q task for sending batch notifications to users with same channel preferences."""
-    from fantasy.models import NotificationType
-
     try:
         notification_type_obj = NotificationType.objects.get(id=notification_type_id)
 
         success = notification_service._send_to_apprise_api(title, message, tags)
 
+        users_by_uuid = {
+            str(user.uuid): user
+            for user in User.objects.filter(uuid__in=user_uuids).only("uuid")
+        }
+        config_count = 1 if notification_service.config_key else 0
+
+        logs = []
         for user_uuid in user_uuids:
-            try:
-                from fantasy.models import User
-                user = User.objects.get(uuid=user_uuid)
-                notification_service._log_notification(
-                    notification_type_obj,
-                    "user",
-                    title,
-                    message,
+            user = users_by_uuid.get(str(user_uuid))
+            if not user:
+                logger.error(f"Error logging for user {user_uuid}: user not found")
+                continue
+            logs.append(
+                NotificationLog(
+                    notification_type=notification_type_obj,
+                    recipient_type="user",
+                    title=title,
+                    message=message,
                     success=success,
                     recipient_user=user,
-                    config_count=1 if notification_service.config_key else 0
+                    config_count=config_count
                 )
-            except Exception as e:
-                logger.error(f"Error logging for user {user_uuid}: {e}")
+            )
+
+        try:
+            NotificationLog.objects.bulk_create(logs, batch_size=500)
+        except Exception as e:
+            logger.error(f"Failed to log batch notification: {e}")
 
         return {"status": "completed", "user_count": len(user_uuids), "success": success}
     except Exception as e:
         logger.error(f"Error in batch notification task: {e}", exc_info=True)
         return {"status": "error", "message": str(e)}
+
+
+def _plan_and_dispatch(notification_type_id, title, message):
+    """Django-Q task that groups recipients by channels and queues one batch per group."""
+    from django_q.tasks import async_task
+
+    try:
+        notification_type_obj = NotificationType.objects.get(id=notification_type_id)
+
+        users_by_channels = notification_service._group_users_by_channels(
+            notification_type_obj
+        )
+
+        if not users_by_channels:
+            logger.info(f"No users have enabled channels for {notification_type_obj.tag}")
+            return {"status": "success", "message": "No users with enabled channels"}
+
+        task_ids = []
+        for tags, user_uuids in users_by_channels.items():
+            task_id = async_task(
+                "fantasy.services.notifications._send_batch_for_channels",
+                notification_type_obj.id,
+                title,
+                message,
+                list(tags),
+                user_uuids
+            )
+            task_ids.append(task_id)
+
+        return {
+            "status": "queued",
+            "batch_count": len(task_ids),
+            "task_ids": task_ids
+        }
+    except Exception as e:
+        logger.error(f"Error in notification planner task: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
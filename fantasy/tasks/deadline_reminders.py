@@ -3,8 +3,23 @@ from datetime import timedelta
 from django.utils import timezone
 from django_q.models import Schedule
 
+from fantasy.models.core import BaseModule
+from fantasy.services.notifications import notification_service
+
 logger = logging.getLogger(__name__)
 
+DEADLINE_REMINDER_MESSAGE = "\n".join(
+    [
+        "Prediction deadline in {time_label}!",
+        "",
+        "Module: {module_name}",
+        "Tournament: {tournament_name}",
+        "Deadline: {deadline}",
+        "",
+        "Submit your predictions now!",
+    ]
+)
+
 
 def schedule_deadline_reminders(module):
     if not module.prediction_deadline:
@@ -16,45 +31,69 @@ def schedule_deadline_reminders(module):
         (30, "30 minutes"),
     ]
 
+    now = timezone.now()
+    reminders = {}
     for minutes_before, label in reminder_times:
         reminder_time = module.prediction_deadline - timedelta(minutes=minutes_before)
 
-        if reminder_time <= timezone.now():
+        if reminder_time <= now:
             continue
 
         task_name = f"deadline_reminder_{module.id}_{minutes_before}min"
+        reminders[task_name] = (label, reminder_time)
 
-        Schedule.objects.update_or_create(
-            name=task_name,
-            defaults={
-                "func": "fantasy.tasks.deadline_reminders.send_deadline_reminder",
-                "args": f"{module.id},{label}",
-                "schedule_type": Schedule.ONCE,
-                "next_run": reminder_time,
-                "repeats": 1,
-            },
-        )
+    if not reminders:
+        return
+
+    # Django-Q literal_evals Schedule.args, so store a tuple literal; the bare
+    # "id,label" form breaks on labels containing spaces.
+    existing = {s.name: s for s in Schedule.objects.filter(name__in=reminders)}
+    to_create = []
+    to_update = []
+
+    for task_name, (label, reminder_time) in reminders.items():
+        fields = {
+            "func": "fantasy.tasks.deadline_reminders.send_deadline_reminder",
+            "args": repr((module.id, label)),
+            "schedule_type": Schedule.ONCE,
+            "next_run": reminder_time,
+            "repeats": 1,
+        }
+        schedule = existing.get(task_name)
+        if schedule:
+            for field, value in fields.items():
+                setattr(schedule, field, value)
+            to_update.append(schedule)
+        else:
+            to_create.append(Schedule(name=task_name, **fields))
         logger.info(f"Scheduled {label} reminder for module {module.id} at {reminder_time}")
 
+    if to_create:
+        Schedule.objects.bulk_create(to_create)
+    if to_update:
+        Schedule.objects.bulk_update(
+            to_update, ["func", "args", "schedule_type", "next_run", "repeats"]
+        )
 
-def send_deadline_reminder(module_id, time_label):
-    from fantasy.models.core import BaseModule
-    from fantasy.services.notifications import notification_service
 
+def send_deadline_reminder(module_id, time_label):
     try:
         module = BaseModule.objects.get(id=module_id)
         real_module = module.get_real_instance()
 
+        message = DEADLINE_REMINDER_MESSAGE.format_map(
+            {
+                "time_label": time_label,
+                "module_name": real_module.name,
+                "tournament_name": real_module.tournament.name,
+                "deadline": real_module.prediction_deadline.strftime("%Y-%m-%d %H:%M UTC"),
+            }
+        )
+
         notification_service.send_to_all_users(
             notification_type="deadline_reminder",
             title=f"Deadline Reminder: {real_module.name}",
-            message=(
-                f"Prediction deadline in {time_label}!\n\n"
-                f"Module: {real_module.name}\n"
-                f"Tournament: {real_module.tournament.name}\n"
-                f"Deadline: {real_module.prediction_deadline.strftime('%Y-%m-%d %H:%M UTC')}\n\n"
-                f"Submit your predictions now!"
-            )
+            message=message,
         )
         logger.info(f"Sent {time_label} deadline reminder for module {module_id}")
     except BaseModule.DoesNotExist:
@@ -6,7 +6,11 @@ including fetching results, parsing, mapping, and scoring.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from fantasy.models.core import Team, Stage, BaseModule, Player
@@ -17,13 +21,16 @@ from fantasy.models.swiss import (
     SwissScoreGroup,
 )
 
-from fantasy.services.fetcher import fetcher
+from fantasy.services.fetcher import Fetcher, fetcher
 
 logger = logging.getLogger(__name__)
 
 # Retry delays in minutes: 1h, 2h, 4h, 6h, 12h, 24h
 POPULATION_RETRY_DELAYS = [60, 120, 240, 360, 720, 1440]
 
+# Concurrent leaderboard fetches when finalizing stat predictions
+STATS_FETCH_WORKERS = 8
+
 
 def populate_stage_modules(stage_id, attempt=0):
     """
@@ -44,7 +51,7 @@ def populate_stage_modules(stage_id, attempt=0):
         dict: Result information with status and details
     """
     try:
-        stage = Stage.objects.get(id=stage_id)
+        stage = Stage.objects.select_related("tournament").get(id=stage_id)
         logger.info(
             f"Populating modules for stage: {stage.name} (attempt {attempt + 1})"
         )
@@ -264,12 +271,16 @@ def _schedule_population_retry(stage_id, attempt, delay_minutes):
 
     next_run = timezone.now() + timedelta(minutes=delay_minutes)
 
-    Schedule.objects.create(
-        func="fantasy.tasks.populate_stage_modules",
-        args=f"{stage_id},{attempt}",
-        name=f"populate_stage_{stage_id}_retry_{attempt}",
-        schedule_type=Schedule.ONCE,
-        next_run=next_run,
+    # One retry row per stage, rescheduled in place on each attempt
+    Schedule.objects.update_or_create(
+        name=f"populate_stage_{stage_id}_retry",
+        defaults={
+            "func": "fantasy.tasks.populate_stage_modules",
+            "args": f"{stage_id},{attempt}",
+            "schedule_type": Schedule.ONCE,
+            "repeats": -1,
+            "next_run": next_run,
+        },
     )
 
 
@@ -309,16 +320,25 @@ def populate_swiss_module(module, parsed_data):
         logger.warning(f"No teams found for Swiss module {module.name}")
         return {"status": "incomplete", "reason": "no_teams"}
 
-    # Get or create teams by hltv_id
-    team_ids = []
-    for team_data in teams_data:
-        team = Team.objects.filter(hltv_id=team_data.hltv_id).first()
-        if team:
-            team_ids.append(team.id)
-        else:
-            logger.warning(
-                f"Team with hltv_id {team_data.hltv_id} ({team_data.name}) not found in database"
-            )
+    wanted_ids = {team_data.hltv_id for team_data in teams_data}
+    id_map = dict(
+        Team.objects.filter(hltv_id__in=wanted_ids).values_list("hltv_id", "id")
+    )
+    team_ids = [
+        id_map[team_data.hltv_id]
+        for team_data in teams_data
+        if team_data.hltv_id in id_map
+    ]
+
+    missing = [
+        f"{team_data.hltv_id} ({team_data.name})"
+        for team_data in teams_data
+        if team_data.hltv_id not in id_map
+    ]
+    if missing:
+        logger.warning(
+            f"Teams with hltv_ids {', '.join(missing)} not found in database"
+        )
 
     if not team_ids:
         return {"status": "incomplete", "reason": "no_matching_teams"}
@@ -351,13 +371,58 @@ def _create_default_swiss_scores(module):
         (2, 3, [eliminated]),
     ]
 
-    for wins, losses, groups in records:
-        score, _ = SwissScore.objects.get_or_create(wins=wins, losses=losses)
-        score.groups.set(groups)
-        SwissModuleScore.objects.get_or_create(
-            module=module, score=score, defaults={"limit_per_user": 3}
+    SwissScore.objects.bulk_create(
+        [SwissScore(wins=wins, losses=losses) for wins, losses, _ in records],
+        ignore_conflicts=True,
+    )
+    score_by_record = {
+        (score.wins, score.losses): score
+        for score in SwissScore.objects.filter(
+            wins__in={wins for wins, _, _ in records},
+            losses__in={losses for _, losses, _ in records},
+        )
+    }
+    scores = [score_by_record[(wins, losses)] for wins, losses, _ in records]
+
+    # Equivalent of score.groups.set(groups) for every score, batched on the
+    # through table
+    through = SwissScore.groups.through
+    wanted_links = {
+        (score.pk, group.pk)
+        for score, (_, _, groups) in zip(scores, records)
+        for group in groups
+    }
+    existing_links = through.objects.filter(
+        swissscore_id__in=[score.pk for score in scores]
+    ).values_list("pk", "swissscore_id", "swissscoregroup_id")
+    stale_link_ids = []
+    for link_id, score_id, group_id in existing_links:
+        if (score_id, group_id) in wanted_links:
+            wanted_links.discard((score_id, group_id))
+        else:
+            stale_link_ids.append(link_id)
+    if stale_link_ids:
+        through.objects.filter(pk__in=stale_link_ids).delete()
+    if wanted_links:
+        through.objects.bulk_create(
+            [
+                through(swissscore_id=score_id, swissscoregroup_id=group_id)
+                for score_id, group_id in wanted_links
+            ],
+            ignore_conflicts=True,
         )
 
+    existing_score_ids = set(
+        SwissModuleScore.objects.filter(module=module).values_list("score_id", flat=True)
+    )
+    SwissModuleScore.objects.bulk_create(
+        [
+            SwissModuleScore(module=module, score=score, limit_per_user=3)
+            for score in scores
+            if score.pk not in existing_score_ids
+        ]
+    )
+
 
 def populate_bracket_module(module, parsed_data):
     """
@@ -384,15 +449,26 @@ def populate_bracket_module(module, parsed_data):
         return {"status": "incomplete", "reason": "no_brackets"}
 
     # Check if matches already exist
-    existing_matches = module.matches.filter(hltv_match_id__isnull=False)
-    match_by_hltv_id = {m.hltv_match_id: m for m in existing_matches}
+    existing_matches = module.matches.filter(hltv_match_id__isnull=False).only(
+        "id", "hltv_match_id", "team_a_id", "team_b_id"
+    )
+    match_by_hltv_id = {
+        m.hltv_match_id: m for m in existing_matches.iterator(chunk_size=500)
+    }
 
-    all_teams = Team.objects.filter(hltv_id__isnull=False)
-    team_by_hltv_id = {t.hltv_id: t for t in all_teams}
+    needed_hltv_ids = {
+        hltv_id
+        for bracket in brackets_data
+        for parsed_match in bracket.matches
+        for hltv_id in (parsed_match.team_a_hltv_id, parsed_match.team_b_hltv_id)
+        if hltv_id is not None
+    }
+    team_by_hltv_id = _get_teams_by_hltv_id(needed_hltv_ids)
 
     created_count = 0
     updated_count = 0
     matches_to_create = []
+    matches_to_update = []
     match_data_by_slot = {}  # For setting up relationships later
 
     for bracket in brackets_data:
@@ -404,17 +480,17 @@ def populate_bracket_module(module, parsed_data):
                 team_a = team_by_hltv_id.get(parsed_match.team_a_hltv_id)
                 team_b = team_by_hltv_id.get(parsed_match.team_b_hltv_id)
 
-                update_fields = []
-                if team_a and existing_match.team_a != team_a:
-                    existing_match.team_a = team_a
-                    update_fields.append("team_a")
-                if team_b and existing_match.team_b != team_b:
-                    existing_match.team_b = team_b
-                    update_fields.append("team_b")
-
-                if update_fields:
-                    existing_match.save(update_fields=update_fields)
-                    updated_count += 1
+                # Compare on ids to avoid lazy-loading the current teams
+                changed = False
+                if team_a and existing_match.team_a_id != team_a.pk:
+                    existing_match.team_a_id = team_a.pk
+                    changed = True
+                if team_b and existing_match.team_b_id != team_b.pk:
+                    existing_match.team_b_id = team_b.pk
+                    changed = True
+
+                if changed:
+                    matches_to_update.append(existing_match)
             else:
                 # Create new match
                 round_num = _extract_round_number(parsed_match.slot_id)
@@ -437,7 +513,7 @@ def populate_bracket_module(module, parsed_data):
                 }
 
     if matches_to_create:
-        BracketMatch.objects.bulk_create(matches_to_create)
+        BracketMatch.objects.bulk_create(matches_to_create, batch_size=500)
         created_count = len(matches_to_create)
         logger.info(f"Created {created_count} bracket matches in module {module.name}")
 
@@ -447,7 +523,11 @@ def populate_bracket_module(module, parsed_data):
         # Auto-tag matches (final, semi-final, etc.)
         _auto_tag_bracket_matches(module)
 
-    if updated_count > 0:
+    if matches_to_update:
+        BracketMatch.objects.bulk_update(
+            matches_to_update, fields=["team_a", "team_b"], batch_size=500
+        )
+        updated_count = len(matches_to_update)
         logger.info(f"Updated {updated_count} bracket matches in module {module.name}")
 
     if created_count == 0 and updated_count == 0:
@@ -462,6 +542,20 @@ def populate_bracket_module(module, parsed_data):
     }
 
 
+def _get_teams_by_hltv_id(hltv_ids):
+    """
+    Fetch only the teams referenced by parsed data, keyed by hltv_id.
+
+    Args:
+        hltv_ids: Iterable of HLTV team IDs
+
+    Returns:
+        dict: hltv_id -> Team
+    """
+    teams = Team.objects.filter(hltv_id__in=hltv_ids).only("id", "hltv_id", "name")
+    return {t.hltv_id: t for t in teams.iterator(chunk_size=500)}
+
+
 def _extract_round_number(slot_id):
     """
     Extract round number from slot_id.
@@ -576,12 +670,15 @@ def _auto_tag_bracket_matches(module):
     Args:
         module: Bracket instance
     """
+    from fantasy.models.bracket import BracketMatch
+
     all_matches = list(module.matches.all())
     if not all_matches:
         return
 
     max_round = max(m.round for m in all_matches)
 
+    changed = []
     for match in all_matches:
         tags = []
         if match.round == max_round:
@@ -593,7 +690,10 @@ def _auto_tag_bracket_matches(module):
 
         if tags and match.tags != tags:
             match.tags = tags
-            match.save(update_fields=["tags"])
+            changed.append(match)
+
+    if changed:
+        BracketMatch.objects.bulk_update(changed, fields=["tags"], batch_size=500)
 
 
 def _get_stage_team_hltv_ids(stat_predictions_module):
@@ -610,58 +710,44 @@ def _get_stage_team_hltv_ids(stat_predictions_module):
     Returns:
         set: Set of team HLTV IDs from stage modules, or None if no teams found
     """
-    from fantasy.models.swiss import SwissModule
-    from fantasy.models.bracket import Bracket
-
-    stage = stat_predictions_module.stage
-    if not stage:
+    stage_id = stat_predictions_module.stage_id
+    if not stage_id:
         logger.debug("StatPredictions module has no stage, cannot filter by stage teams")
         return None
 
-    team_hltv_ids = set()
-
-    swiss_modules = SwissModule.objects.filter(stage=stage).prefetch_related("teams")
-    for swiss_module in swiss_modules:
-        swiss_team_ids = swiss_module.teams.filter(hltv_id__isnull=False).values_list(
-            "hltv_id", flat=True
-        )
-        team_hltv_ids.update(swiss_team_ids)
-        logger.debug(
-            f"Found {len(swiss_team_ids)} teams in Swiss module '{swiss_module.name}'"
+    # One query over both module types; distinct() collapses the join fan-out
+    team_hltv_ids = set(
+        Team.objects.filter(
+            Q(swiss_modules__stage_id=stage_id)
+            | Q(bracket_matches_a__bracket__stage_id=stage_id)
+            | Q(bracket_matches_b__bracket__stage_id=stage_id),
+            hltv_id__isnull=False,
         )
-
-    bracket_modules = Bracket.objects.filter(stage=stage).prefetch_related(
-        "matches__team_a", "matches__team_b"
+        .values_list("hltv_id", flat=True)
+        .distinct()
     )
-    for bracket_module in bracket_modules:
-        bracket_team_ids = set()
-        for match in bracket_module.matches.all():
-            if match.team_a and match.team_a.hltv_id:
-                bracket_team_ids.add(match.team_a.hltv_id)
-            if match.team_b and match.team_b.hltv_id:
-                bracket_team_ids.add(match.team_b.hltv_id)
-        team_hltv_ids.update(bracket_team_ids)
-        logger.debug(
-            f"Found {len(bracket_team_ids)} teams in Bracket module '{bracket_module.name}'"
-        )
 
     if not team_hltv_ids:
         logger.debug(
-            f"No teams found in Swiss or Bracket modules for stage '{stage.name}', "
+            f"No teams found in Swiss or Bracket modules for stage {stage_id}, "
             "will use all parsed players"
         )
         return None
 
     logger.info(
-        f"Found {len(team_hltv_ids)} total unique teams in stage '{stage.name}' modules"
+        f"Found {len(team_hltv_ids)} total unique teams in stage {stage_id} modules"
     )
     return team_hltv_ids
 
 
+@transaction.atomic
 def populate_stat_predictions_module(module, parsed_data):
     """
     Populate stat predictions module by adding players from stage/tournament to all definitions.
 
+    Runs in a single transaction, so the per-row Team/Player creates share one
+    commit and a failure part-way leaves no half-populated module behind.
+
     Args:
         module: StatPredictionsModule instance
         parsed_data: Dict with parsed HLTV data containing players and teams
@@ -687,19 +773,30 @@ def populate_stat_predictions_module(module, parsed_data):
     teams_created_count = 0
     teams_updated_count = 0
 
+    # Only the columns compared or rewritten below
+    existing_teams = Team.objects.only("id", "hltv_id", "name").in_bulk(
+        [team_data.hltv_id for team_data in teams_data], field_name="hltv_id"
+    )
+    teams_to_update = []
     for team_data in teams_data:
-        team, created = Team.objects.get_or_create(
-            hltv_id=team_data.hltv_id, defaults={"name": team_data.name}
-        )
-
-        if created:
+        team = existing_teams.get(team_data.hltv_id)
+        if team is None:
+            # Multi-table inheritance rules out bulk_create, and save() also
+            # generates the search aliases
+            team = Team.objects.create(hltv_id=team_data.hltv_id, name=team_data.name)
+            existing_teams[team.hltv_id] = team
             teams_created_count += 1
         elif team.name != team_data.name:
             team.name = team_data.name
-            team.save(update_fields=["name"])
-            teams_updated_count += 1
+            teams_to_update.append(team)
 
-    team_by_hltv_id = {t.hltv_id: t for t in Team.objects.filter(hltv_id__isnull=False)}
+    if teams_to_update:
+        Team.objects.bulk_update(teams_to_update, ["name"], batch_size=500)
+        teams_updated_count = len(teams_to_update)
+
+    team_by_hltv_id = _get_teams_by_hltv_id(
+        {p.team_hltv_id for p in players_data if p.team_hltv_id is not None}
+    )
 
     stage_team_hltv_ids = _get_stage_team_hltv_ids(module)
     if stage_team_hltv_ids:
@@ -711,23 +808,32 @@ def populate_stat_predictions_module(module, parsed_data):
         ]
         logger.info(f"Filtered to {len(players_data)} players")
 
+    existing_players = Player.objects.only("id", "hltv_id", "name").in_bulk(
+        [player_data.hltv_id for player_data in players_data], field_name="hltv_id"
+    )
+    players_to_update = []
     player_ids = []
     for player_data in players_data:
-        team = team_by_hltv_id.get(player_data.team_hltv_id)
-        player, created = Player.objects.get_or_create(
-            hltv_id=player_data.hltv_id,
-            defaults={"name": player_data.name, "active_team": team},
-        )
-
-        if created:
+        player = existing_players.get(player_data.hltv_id)
+        if player is None:
+            # Same multi-table inheritance/alias constraints as Team above
+            player = Player.objects.create(
+                hltv_id=player_data.hltv_id,
+                name=player_data.name,
+                active_team=team_by_hltv_id.get(player_data.team_hltv_id),
+            )
+            existing_players[player.hltv_id] = player
             players_created_count += 1
         elif player.name != player_data.name:
             player.name = player_data.name
-            player.save(update_fields=["name"])
-            players_updated_count += 1
+            players_to_update.append(player)
 
         player_ids.append(player.id)
 
+    if players_to_update:
+        Player.objects.bulk_update(players_to_update, ["name"], batch_size=500)
+        players_updated_count = len(players_to_update)
+
     logger.info(
         f"StatPredictions module {module.name}: "
         f"{players_created_count} players created, {players_updated_count} updated, "
@@ -736,10 +842,11 @@ def populate_stat_predictions_module(module, parsed_data):
 
     options_added_count = 0
     definitions_count = module.definitions.count()
+    player_id_set = frozenset(player_ids)
 
     for definition in module.definitions.all():
         existing_option_ids = set(definition.options.values_list("id", flat=True))
-        new_player_ids = set(player_ids) - existing_option_ids
+        new_player_ids = player_id_set - existing_option_ids
 
         if new_player_ids:
             definition.options.add(*new_player_ids)
@@ -786,7 +893,11 @@ def finalize_module(content_type_id, module_id):
     """
     try:
         ct = ContentType.objects.get_for_id(content_type_id)
-        module = ct.get_object_for_this_type(id=module_id)
+        module = (
+            ct.model_class()
+            ._base_manager.select_related("tournament")
+            .get(id=module_id)
+        )
 
         logger.info(
             f"Starting finalization for {ct.model} module {module_id}: {module.name}"
@@ -836,6 +947,28 @@ def finalize_module(content_type_id, module_id):
         raise  # Let Django-Q handle retry
 
 
+def _mark_module_completed(module):
+    """
+    Flag a module as completed with a single UPDATE.
+
+    Bypasses BaseModule.save(), which would re-read the row and reschedule
+    deadline reminders, and runs the stage advancement check it would have
+    triggered.
+
+    Args:
+        module: BaseModule instance
+    """
+    was_completed = module.is_completed
+    module.is_completed = True
+    module.finalized_at = timezone.now()
+    BaseModule.objects.filter(pk=module.pk).update(
+        is_completed=True, finalized_at=module.finalized_at
+    )
+    module._remember_saved_state()
+    if not was_completed:
+        module._check_stage_advancement()
+
+
 def get_module_handler(module_type):
     """
     Registry pattern - maps module types to handlers.
@@ -855,6 +988,22 @@ def get_module_handler(module_type):
     return HANDLERS.get(module_type)
 
 
+def _parse_swiss_record(record):
+    """
+    Split a Swiss record string like "3-0" into a (wins, losses) tuple.
+
+    Returns:
+        tuple: (wins, losses), or None if the record is malformed
+    """
+    wins, sep, losses = record.partition("-")
+    if not sep:
+        return None
+    try:
+        return int(wins), int(losses)
+    except ValueError:
+        return None
+
+
 def finalize_swiss_module_internal(module):
     """
     Handle Swiss module finalization.
@@ -890,14 +1039,14 @@ def finalize_swiss_module_internal(module):
 
     swiss_results_to_create_or_update = []
 
-    teams_in_module = module.teams.all()
-    team_by_hltv_id = {
-        team.hltv_id: team for team in teams_in_module if team.hltv_id is not None
-    }
+    teams_in_module = module.teams.filter(hltv_id__isnull=False).only(
+        "id", "hltv_id", "name"
+    )
+    team_by_hltv_id = {team.hltv_id: team for team in teams_in_module}
 
     swiss_module_scores = module.scores.select_related("score").all()
     swiss_module_score_by_record = {
-        f"{sms.score.wins}-{sms.score.losses}": sms for sms in swiss_module_scores
+        (sms.score.wins, sms.score.losses): sms for sms in swiss_module_scores
     }
 
     for parsed_result_row in parsed_results:
@@ -905,7 +1054,9 @@ def finalize_swiss_module_internal(module):
         record_string = parsed_result_row.record  # e.g., "3-0"
 
         team = team_by_hltv_id.get(team_hltv_id)
-        swiss_module_score = swiss_module_score_by_record.get(record_string)
+        swiss_module_score = swiss_module_score_by_record.get(
+            _parse_swiss_record(record_string)
+        )
 
         if not team:
             logger.warning(
@@ -928,6 +1079,7 @@ def finalize_swiss_module_internal(module):
             update_conflicts=True,
             unique_fields=["swiss_module", "team"],
             update_fields=["score"],
+            batch_size=500,
         )
         logger.info(
             f"Saved {len(swiss_results_to_create_or_update)} Swiss results to database"
@@ -938,9 +1090,7 @@ def finalize_swiss_module_internal(module):
     logger.info(f"Calculating scores for Swiss module {module.id}")
     module.calculate_scores()
 
-    module.is_completed = True
-    module.finalized_at = timezone.now()
-    module.save(update_fields=["is_completed", "finalized_at"])
+    _mark_module_completed(module)
 
     logger.info(f"Successfully finalized Swiss module {module.id}")
 
@@ -970,6 +1120,7 @@ def finalize_bracket_module_internal(module):
     """
     logger.info(f"Finalizing Bracket module: {module.name}")
 
+    from fantasy.models.bracket import BracketMatch
     from fantasy.services.hltv_parser import parse_brackets
 
     if not module.tournament.hltv_url:
@@ -985,13 +1136,22 @@ def finalize_bracket_module_internal(module):
     parsed_brackets = parse_brackets(html)
     logger.debug(f"Parsed {len(parsed_brackets)} brackets")
 
-    bracket_matches = module.matches.filter(hltv_match_id__isnull=False)
-    match_by_hltv_id = {m.hltv_match_id: m for m in bracket_matches}
+    bracket_matches = module.matches.filter(hltv_match_id__isnull=False).only(
+        "id", "hltv_match_id", "team_a_score", "team_b_score", "winner_id"
+    )
+    match_by_hltv_id = {
+        m.hltv_match_id: m for m in bracket_matches.iterator(chunk_size=500)
+    }
 
-    all_teams = Team.objects.filter(hltv_id__isnull=False)
-    team_by_hltv_id = {t.hltv_id: t for t in all_teams}
+    winner_hltv_ids = {
+        parsed_match.winner_hltv_id
+        for parsed_bracket in parsed_brackets
+        for parsed_match in parsed_bracket.matches
+        if parsed_match.winner_hltv_id is not None
+    }
+    team_by_hltv_id = _get_teams_by_hltv_id(winner_hltv_ids)
 
-    updated_count = 0
+    updated_matches = []
     for parsed_bracket in parsed_brackets:
         for parsed_match in parsed_bracket.matches:
             bracket_match = match_by_hltv_id.get(parsed_match.hltv_match_id)
@@ -1011,17 +1171,20 @@ def finalize_bracket_module_internal(module):
             bracket_match.team_a_score = parsed_match.team_a_score
             bracket_match.team_b_score = parsed_match.team_b_score
             bracket_match.winner = winner
-            bracket_match.save(update_fields=["team_a_score", "team_b_score", "winner"])
-            updated_count += 1
+            updated_matches.append(bracket_match)
 
+    BracketMatch.objects.bulk_update(
+        updated_matches,
+        fields=["team_a_score", "team_b_score", "winner"],
+        batch_size=500,
+    )
+    updated_count = len(updated_matches)
     logger.info(f"Updated {updated_count} bracket matches")
 
     logger.info(f"Calculating scores for Bracket module {module.id}")
     module.calculate_scores()
 
-    module.is_completed = True
-    module.finalized_at = timezone.now()
-    module.save(update_fields=["is_completed", "finalized_at"])
+    _mark_module_completed(module)
 
     logger.info(f"Successfully finalized Bracket module {module.id}")
 
@@ -1034,6 +1197,43 @@ def finalize_bracket_module_internal(module):
     }
 
 
+def _fetch_definition_htmls(definitions, module):
+    """
+    Fetch leaderboard pages for stat definitions concurrently.
+
+    Each worker thread uses its own Fetcher (curl_cffi sessions are not
+    shared across threads) and closes its DB connection when done. Parsing
+    and ORM writes stay on the calling thread.
+
+    Args:
+        definitions: StatPredictionDefinition instances with a source_url
+        module: StatPredictionsModule used for cache TTL
+
+    Returns:
+        list: HTML strings in the same order as definitions
+    """
+    if len(definitions) <= 1:
+        return [
+            fetcher.fetch(url=definition.source_url, module=module)
+            for definition in definitions
+        ]
+
+    local = threading.local()
+
+    def fetch(url):
+        if not hasattr(local, "fetcher"):
+            local.fetcher = Fetcher()
+        try:
+            return local.fetcher.fetch(url=url, module=module)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(
+        max_workers=min(STATS_FETCH_WORKERS, len(definitions))
+    ) as executor:
+        return list(executor.map(fetch, [d.source_url for d in definitions]))
+
+
 def finalize_stats_module_internal(module):
     """
     Handle Stat Predictions module finalization.
@@ -1058,6 +1258,7 @@ def finalize_stats_module_internal(module):
     definitions_processed = 0
     definitions_skipped = 0
 
+    definitions = []
     for definition in module.definitions.all():
         if not definition.source_url:
             logger.warning(
@@ -1065,11 +1266,13 @@ def finalize_stats_module_internal(module):
             )
             definitions_skipped += 1
             continue
+        definitions.append(definition)
 
-        html = fetcher.fetch(
-            url=definition.source_url,
-            module=module,
-        )
+    htmls = _fetch_definition_htmls(definitions, module)
+
+    results_to_save = []
+
+    for definition, html in zip(definitions, htmls):
         logger.debug(f"Fetched {len(html)} chars for {definition.title}")
 
         leaderboard = parse_leaderboard(html)
@@ -1090,15 +1293,26 @@ def finalize_stats_module_internal(module):
             for entry in leaderboard
         ]
 
-        StatPredictionResult.objects.update_or_create(
-            definition=definition,
-            defaults={
-                "results": results_data,
-                "is_final": True,
-            },
+        if definition.invert_results:
+            # Mirrors StatPredictionResult.save(), which bulk_create skips
+            results_data.reverse()
+
+        results_to_save.append(
+            StatPredictionResult(
+                definition=definition, results=results_data, is_final=True
+            )
         )
         definitions_processed += 1
 
+    if results_to_save:
+        StatPredictionResult.objects.bulk_create(
+            results_to_save,
+            update_conflicts=True,
+            unique_fields=["definition"],
+            update_fields=["results", "is_final", "updated_at"],
+            batch_size=500,
+        )
+
     logger.info(
         f"Processed {definitions_processed} definitions, skipped {definitions_skipped}"
     )
@@ -1106,9 +1320,7 @@ def finalize_stats_module_internal(module):
     logger.info(f"Calculating scores for Stats module {module.id}")
     module.calculate_scores()
 
-    module.is_completed = True
-    module.finalized_at = timezone.now()
-    module.save(update_fields=["is_completed", "finalized_at"])
+    _mark_module_completed(module)
 
     logger.info(f"Successfully finalized Stats module {module.id}")
 
@@ -5,7 +5,10 @@ This module provides a wrapper function for scheduling the
 update_tournament_results management command via Django-Q.
 """
 import logging
-from django.core.management import call_command
+
+from fantasy.management.commands.update_tournament_results import (
+    update_tournament_results,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +17,8 @@ def update_tournament_results_task(tournament_id):
     """
     Django-Q task wrapper for updating tournament results.
 
-    This function wraps the update_tournament_results management command
-    to make it easier to schedule with Django-Q.
+    This function runs the update_tournament_results management command
+    logic directly to make it easier to schedule with Django-Q.
 
     Args:
         tournament_id: ID of the tournament to update
@@ -26,7 +29,7 @@ def update_tournament_results_task(tournament_id):
     logger.info(f"Starting scheduled update for tournament {tournament_id}")
 
     try:
-        call_command('update_tournament_results', tournament_id, verbosity=2)
+        update_tournament_results(tournament_id)
         logger.info(f"Completed scheduled update for tournament {tournament_id}")
     except Exception as e:
         logger.error(f"Failed scheduled update for tournament {tournament_id}: {e}", exc_info=True)
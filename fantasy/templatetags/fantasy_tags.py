@@ -1,11 +1,20 @@
 from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from django import template
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, FieldError
+from django.db.models import Max, Min, QuerySet
 from django.template.loader import get_template
-from ..utils.colors import interpolate_color
+from ..utils.colors import interpolate_color_cached
 
 register = template.Library()
 
 
+@lru_cache(maxsize=256)
+def _get_template_cached(template_name):
+    return get_template(template_name)
+
+
 @register.simple_tag(takes_context=True)
 def dynamic_include(context, template_name, keys_dict):
     """
@@ -14,7 +23,11 @@ def dynamic_include(context, template_name, keys_dict):
     directly into the context for the included template.
     """
 
-    template_instance = get_template(template_name)
+    # Skip the cache in DEBUG so edited templates are picked up on reload
+    if settings.DEBUG:
+        template_instance = get_template(template_name)
+    else:
+        template_instance = _get_template_cached(template_name)
 
     if isinstance(keys_dict, dict):
         return template_instance.render(keys_dict)
@@ -59,8 +72,56 @@ def dataclass_asdict(value):
     return value
 
 
-@register.simple_tag
-def gradient_color(value, start_color, end_color, queryset, attr_name):
+def _gradient_bounds(context, queryset, attr_name):
+    """
+    Return (min, max) of attr_name over queryset, cached for the current render.
+
+    Unevaluated querysets are reduced in the database with one aggregate query;
+    anything else (lists, evaluated querysets, non-field attributes) falls back
+    to scanning in Python.
+    """
+    is_queryset = isinstance(queryset, QuerySet)
+    if is_queryset:
+        try:
+            source_key = (queryset.model, str(queryset.query))
+        except EmptyResultSet:
+            # .none() and filter(pk__in=[]) compile to no SQL at all
+            return ()
+    else:
+        source_key = id(queryset)
+    cache_key = ("gradient_bounds", source_key, attr_name)
+
+    if cache_key in context.render_context:
+        return context.render_context[cache_key]
+
+    bounds = None
+    if is_queryset and queryset._result_cache is None:
+        try:
+            aggregated = queryset.aggregate(min_val=Min(attr_name), max_val=Max(attr_name))
+            bounds = (aggregated["min_val"], aggregated["max_val"])
+            if bounds[0] is None:
+                bounds = ()
+        except FieldError:
+            bounds = None
+
+    if bounds is None:
+        min_val = max_val = None
+        for obj in queryset:
+            val = getattr(obj, attr_name)
+            if min_val is None:
+                min_val = max_val = val
+            elif val < min_val:
+                min_val = val
+            elif val > max_val:
+                max_val = val
+        bounds = (min_val, max_val) if min_val is not None else ()
+
+    context.render_context[cache_key] = bounds
+    return bounds
+
+
+@register.simple_tag(takes_context=True)
+def gradient_color(context, value, start_color, end_color, queryset, attr_name):
     """
     Calculate gradient color for a value based on min/max from queryset.
 
@@ -78,19 +139,18 @@ def gradient_color(value, start_color, end_color, queryset, attr_name):
         {% gradient_color user_tournament_score.total_points '#5b6836' '#198754' tournament_scores 'total_points' %}
     """
     try:
-        values = [getattr(obj, attr_name) for obj in queryset]
+        bounds = _gradient_bounds(context, queryset, attr_name)
 
-        if not values:
+        if not bounds:
             return start_color
 
-        min_val = min(values)
-        max_val = max(values)
+        min_val, max_val = bounds
 
         if min_val == max_val:
             factor = 1.0
         else:
             factor = (value - min_val) / (max_val - min_val)
 
-        return interpolate_color(start_color, end_color, factor)
+        return interpolate_color_cached(start_color, end_color, factor)
     except (AttributeError, TypeError, ZeroDivisionError):
         return start_color
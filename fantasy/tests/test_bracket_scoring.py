@@ -1,22 +1,42 @@
-from django.test import TestCase
+from dataclasses import dataclass
+from typing import Optional
+
+from django.test import SimpleTestCase
 from fantasy.models.bracket import get_default_bracket_scoring_config
 from fantasy.utils.scoring_engine import evaluate_rules, eval_condition
 from fantasy.utils.scoring_schema import validate_scoring_config
 
 
-class BracketScoringConfigTest(TestCase):
+@dataclass(slots=True)
+class _MockPrediction:
+    """Lightweight stand-in for a bracket prediction in scoring tests."""
+
+    pk: Optional[int] = None
+    team_a_id: Optional[int] = None
+    team_b_id: Optional[int] = None
+    team_c_id: Optional[int] = None
+    predicted_team_a_score: Optional[int] = None
+    predicted_team_b_score: Optional[int] = None
+    predicted_winner_id: Optional[int] = None
+    predicted_loser_id: Optional[int] = None
+
+
+class BracketScoringConfigTest(SimpleTestCase):
     """Tests for bracket scoring configuration."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config = get_default_bracket_scoring_config()
+
     def test_default_bracket_scoring_config_valid(self):
         """Test that default bracket scoring config is valid."""
-        config = get_default_bracket_scoring_config()
-        is_valid, errors = validate_scoring_config(config)
+        is_valid, errors = validate_scoring_config(self.config)
         self.assertTrue(is_valid, f"Config validation failed: {errors}")
 
     def test_default_bracket_scoring_has_correct_rules(self):
         """Test that the new default config has the correct rules."""
-        config = get_default_bracket_scoring_config()
-        rules = config.get("rules", [])
+        rules = self.config.get("rules", [])
 
         self.assertEqual(len(rules), 6)
         self.assertEqual(rules[0]["id"], "correct_final_winner_bonus")
@@ -44,28 +64,27 @@ class BracketScoringConfigTest(TestCase):
         self.assertEqual(rules[5]["scoring"]["value"], 1)
 
 
-class NewBracketScoringLogicTest(TestCase):
+class NewBracketScoringLogicTest(SimpleTestCase):
     """Tests for the new bracket scoring logic."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the scoring config once; tests only read it."""
+        super().setUpClass()
+        cls.config = get_default_bracket_scoring_config()
+        cls.rules = cls.config["rules"]
+
     def setUp(self):
-        """Set up test data."""
-        self.config = get_default_bracket_scoring_config()
-        self.rules = self.config["rules"]
-
-        # Base mock prediction
-        self.prediction = type(
-            "Prediction",
-            (),
-            {
-                "pk": 1,
-                "team_a_id": 1,
-                "team_b_id": 2,
-                "predicted_team_a_score": 2,
-                "predicted_team_b_score": 1,
-                "predicted_winner_id": 1,
-                "predicted_loser_id": 2,
-            },
-        )()
+        """Set up the base mock prediction; some tests mutate it."""
+        self.prediction = _MockPrediction(
+            pk=1,
+            team_a_id=1,
+            team_b_id=2,
+            predicted_team_a_score=2,
+            predicted_team_b_score=1,
+            predicted_winner_id=1,
+            predicted_loser_id=2,
+        )
 
     def test_correct_winner_score_and_matchup_awards_3_points(self):
         """Test a perfect prediction awards 3 points and stops evaluation."""
@@ -111,11 +130,11 @@ class NewBracketScoringLogicTest(TestCase):
             "tags": [],
         }
         # We need to adjust the prediction to test this rule
-        prediction = type("Prediction", (), {
-            "pk": 1, "team_a_id": 4, "team_b_id": 1,
-            "predicted_team_a_score": 1, "predicted_team_b_score": 2,
-            "predicted_winner_id": 1, "predicted_loser_id": 4
-        })()
+        prediction = _MockPrediction(
+            pk=1, team_a_id=4, team_b_id=1,
+            predicted_team_a_score=1, predicted_team_b_score=2,
+            predicted_winner_id=1, predicted_loser_id=4
+        )
         # The result has team B (id 2) as the loser, but the prediction has team A (id 4)
         # Let's align them.
         prediction.predicted_loser_id = 2
@@ -196,7 +215,7 @@ class NewBracketScoringLogicTest(TestCase):
         self.assertEqual(len(evaluation.breakdown), 0)
 
 
-class SetEqualOperatorTest(TestCase):
+class SetEqualOperatorTest(SimpleTestCase):
     """Tests for the set_equal operator."""
 
     def test_set_equal_with_identical_sets(self):
@@ -206,7 +225,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": 2})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=2)
         result = {"team_a_id": 1, "team_b_id": 2}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -218,7 +237,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": 2})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=2)
         result = {"team_a_id": 2, "team_b_id": 1}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -230,7 +249,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": 2})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=2)
         result = {"team_a_id": 3, "team_b_id": 4}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -242,7 +261,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": 2})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=2)
         result = {"team_a_id": 1, "team_b_id": 3}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -254,7 +273,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": None})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=None)
         result = {"team_a_id": 1, "team_b_id": None}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -266,7 +285,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": None})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=None)
         result = {"team_a_id": 1, "team_b_id": 2}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -278,7 +297,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": None, "team_b_id": None})()
+        prediction = _MockPrediction(team_a_id=None, team_b_id=None)
         result = {"team_a_id": None, "team_b_id": None}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -290,7 +309,7 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1})()
+        prediction = _MockPrediction(team_a_id=1)
         result = {"team_a_id": 1, "team_b_id": 2}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -302,13 +321,13 @@ class SetEqualOperatorTest(TestCase):
             "source_list": ["prediction.team_a_id", "prediction.team_b_id", "prediction.team_c_id"],
             "target_list": ["result.team_a_id", "result.team_b_id"],
         }
-        prediction = type("Prediction", (), {"team_a_id": 1, "team_b_id": 1, "team_c_id": 2})()
+        prediction = _MockPrediction(team_a_id=1, team_b_id=1, team_c_id=2)
         result = {"team_a_id": 1, "team_b_id": 2}
 
         self.assertTrue(eval_condition(condition, prediction, result))
 
 
-class ListContainsLiteralOperatorTest(TestCase):
+class ListContainsLiteralOperatorTest(SimpleTestCase):
     """Tests for the list_contains_literal operator."""
 
     def test_list_contains_literal_with_match(self):
@@ -318,7 +337,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": ["final", "best-of-5"]}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -330,7 +349,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": ["semi-final", "best-of-3"]}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -342,7 +361,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": []}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -354,7 +373,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": None,
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": ["final"]}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -366,7 +385,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": None}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -378,7 +397,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": "final"}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -390,7 +409,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "Final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": ["final", "best-of-5"]}
 
         self.assertFalse(eval_condition(condition, prediction, result))
@@ -402,7 +421,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": "final",
             "target_list": "result.tags",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"tags": ["final"]}
 
         self.assertTrue(eval_condition(condition, prediction, result))
@@ -414,7 +433,7 @@ class ListContainsLiteralOperatorTest(TestCase):
             "source_value": 42,
             "target_list": "result.numbers",
         }
-        prediction = type("Prediction", (), {})()
+        prediction = _MockPrediction()
         result = {"numbers": [1, 42, 100]}
 
         self.assertTrue(eval_condition(condition, prediction, result))
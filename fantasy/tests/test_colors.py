@@ -0,0 +1,17 @@
+from django.test import SimpleTestCase
+
+from fantasy.utils.colors import interpolate_color, interpolate_color_cached
+
+
+class InterpolateColorCachedTest(SimpleTestCase):
+    def test_matches_interpolate_color(self):
+        for factor in (0.0, 1.0, 0.5, 0.3333):
+            with self.subTest(factor=factor):
+                self.assertEqual(
+                    interpolate_color_cached("#5b6836", "#198754", factor),
+                    interpolate_color("#5b6836", "#198754", factor),
+                )
+
+    def test_out_of_range_factor_is_clamped(self):
+        self.assertEqual(interpolate_color_cached("#000000", "#FFFFFF", -1), "#000000")
+        self.assertEqual(interpolate_color_cached("#000000", "#FFFFFF", 2), "#FFFFFF")
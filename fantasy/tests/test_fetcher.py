@@ -0,0 +1,50 @@
+import importlib
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from fantasy.services.fetcher import Fetcher
+
+# fantasy.services re-exports the `fetcher` singleton under the module's name
+fetcher_module = importlib.import_module("fantasy.services.fetcher")
+
+URL = "https://www.hltv.org/events/7148/test-event"
+
+
+class FetcherLocalCacheTest(SimpleTestCase):
+    def setUp(self):
+        patcher = patch.object(fetcher_module, "_local_cache", OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cache = MagicMock()
+        self.cache.get.return_value = None
+        source_patcher = patch.object(
+            Fetcher, "_fetch_from_source", return_value="<html>page</html>"
+        )
+        self.mock_source = source_patcher.start()
+        self.addCleanup(source_patcher.stop)
+
+    def test_memo_is_shared_between_instances(self):
+        self.assertEqual(Fetcher(cache=self.cache).fetch(URL), "<html>page</html>")
+        self.assertEqual(Fetcher(cache=self.cache).fetch(URL), "<html>page</html>")
+
+        self.mock_source.assert_called_once()
+        self.cache.get.assert_called_once()
+
+    def test_force_refresh_bypasses_memo(self):
+        fetcher = Fetcher(cache=self.cache)
+        fetcher.fetch(URL)
+        fetcher.fetch(URL, force_refresh=True)
+
+        self.assertEqual(self.mock_source.call_count, 2)
+
+    def test_invalidate_cache_drops_memo(self):
+        fetcher = Fetcher(cache=self.cache)
+        fetcher.fetch(URL)
+        Fetcher(cache=self.cache).invalidate_cache(URL)
+        fetcher.fetch(URL)
+
+        self.assertEqual(self.mock_source.call_count, 2)
+        self.cache.invalidate.assert_called_once()
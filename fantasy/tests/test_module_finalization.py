@@ -1,9 +1,16 @@
+"""
+Tests for module finalization, stage population and their scheduling.
 
+Every DB-backed class here is a plain TestCase: its data lives inside the
+per-test transaction and is rolled back, so the suite is safe to run
+against a kept test database (`manage.py test --keepdb`).
+"""
 import logging
 from unittest.mock import patch, MagicMock
 
-from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from fantasy.models import (
@@ -14,10 +21,13 @@ from fantasy.models.bracket import Bracket, BracketMatch
 from fantasy.models.stat_predictions import (
     StatPredictionsModule, StatPredictionCategory, StatPredictionDefinition, StatPredictionResult
 )
+from fantasy.services import hltv_parser
+from fantasy.services.fetcher import Fetcher
 from fantasy.services.hltv_parser import (
     ResultRow, BracketMatchResult, ParsedBracket, LeaderboardEntry,
     Team as ParsedTeam, Player as ParsedPlayer
 )
+from fantasy.tasks import module_finalization
 from fantasy.tasks.module_finalization import (
     finalize_module,
     finalize_swiss_module_internal,
@@ -35,53 +45,94 @@ from fantasy.tasks.module_finalization import (
 
 
 
-class FinalizeSwissModuleTest(TestCase):
-    def setUp(self):
-        """Set up a tournament and a Swiss module with teams and scores."""
-        self.tournament = Tournament.objects.create(
+class _TournamentFixtureMixin:
+    """
+    Creates the tournament and its first stage once per class.
+
+    Subclasses tune the shared fixture through the class attributes below and
+    extend setUpTestData with their own modules. With create_teams set, the
+    HLTV 101/102 teams most parsed fixtures refer to are created as well.
+    Dates are offsets from a single cls.now taken when the fixture is built.
+    """
+
+    stage_name = "Group Stage"
+    tournament_end = timezone.timedelta(days=-1)
+    tournament_hltv_url = "http://fake-hltv-url.com/event/123"
+    create_teams = False
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.now = timezone.now()
+        cls.tournament = Tournament.objects.create(
             name="Test Tournament",
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
-            hltv_url="http://fake-hltv-url.com/event/123",
+            start_date=cls.now - timezone.timedelta(days=10),
+            end_date=cls.now + cls.tournament_end,
+            hltv_url=cls.tournament_hltv_url,
         )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Group Stage",
+        cls.stage = Stage.objects.create(
+            tournament=cls.tournament,
+            name=cls.stage_name,
             order=1,
         )
-        self.module = SwissModule.objects.create(
+        if cls.create_teams:
+            # Team is a multi-table polymorphic model and builds its aliases
+            # in save(), so it can't go through bulk_create.
+            cls.team1 = Team.objects.create(name="Team A", hltv_id=101)
+            cls.team2 = Team.objects.create(name="Team B", hltv_id=102)
+
+
+class FinalizeSwissModuleTest(_TournamentFixtureMixin, TestCase):
+    create_teams = True
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a tournament and a Swiss module with teams and scores."""
+        super().setUpTestData()
+        cls.module = SwissModule.objects.create(
             name="Test Swiss Module",
-            tournament=self.tournament,
-            stage=self.stage,
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
+            tournament=cls.tournament,
+            stage=cls.stage,
+            start_date=cls.now - timezone.timedelta(days=10),
+            end_date=cls.now - timezone.timedelta(days=1),
         )
 
-        # Create teams
-        self.team1 = Team.objects.create(name="Team A", hltv_id=101)
-        self.team2 = Team.objects.create(name="Team B", hltv_id=102)
-        self.team3 = Team.objects.create(name="Team C", hltv_id=103)
-        self.team4 = Team.objects.create(name="Team D (not in module)", hltv_id=104)
+        cls.team3 = Team.objects.create(name="Team C", hltv_id=103)
+        cls.team4 = Team.objects.create(name="Team D (not in module)", hltv_id=104)
 
-        self.module.teams.add(self.team1, self.team2, self.team3)
+        cls.module.teams.add(cls.team1, cls.team2, cls.team3)
 
-        # Create scores (3-0 and 2-1)
-        self.score_3_0 = SwissScore.objects.create(wins=3, losses=0)
-        self.score_2_1 = SwissScore.objects.create(wins=2, losses=1)
-        self.score_1_2 = SwissScore.objects.create(wins=1, losses=2) # For update test
+        cls._make_scores()
 
-        self.module_score_3_0 = SwissModuleScore.objects.create(
-            module=self.module, score=self.score_3_0
-        )
-        self.module_score_2_1 = SwissModuleScore.objects.create(
-            module=self.module, score=self.score_2_1
+    @classmethod
+    def _make_scores(cls):
+        """Create the 3-0 and 2-1 scores, plus 1-2 for the update test."""
+        records = [(3, 0), (2, 1), (1, 2)]
+        cls.scores = SwissScore.objects.bulk_create(
+            [SwissScore(wins=wins, losses=losses) for wins, losses in records]
         )
-        self.module_score_1_2 = SwissModuleScore.objects.create(
-            module=self.module, score=self.score_1_2
+        cls.module_scores = SwissModuleScore.objects.bulk_create(
+            [SwissModuleScore(module=cls.module, score=s) for s in cls.scores]
         )
+        cls.score_3_0, cls.score_2_1, cls.score_1_2 = cls.scores
+        (
+            cls.module_score_3_0,
+            cls.module_score_2_1,
+            cls.module_score_1_2,
+        ) = cls.module_scores
+
+    def setUp(self):
+        # Score calculation has its own tests; just check it gets triggered
+        patcher = patch.object(self.module, "calculate_scores")
+        self.mock_calculate_scores = patcher.start()
+        self.addCleanup(patcher.stop)
 
-    @patch("fantasy.services.hltv_parser.parse_swiss")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    def _result_scores(self):
+        """Map team id -> module score id for every SwissResult, in one query."""
+        return dict(SwissResult.objects.values_list("team_id", "score_id"))
+
+    @patch.object(hltv_parser, "parse_swiss")
+    @patch.object(Fetcher, "fetch")
     def test_successful_finalization(self, mock_fetch, mock_parse_swiss):
         """Test a full, successful finalization flow."""
         # Mock external calls
@@ -91,9 +142,6 @@ class FinalizeSwissModuleTest(TestCase):
             ResultRow(team_hltv_id=102, record="2-1"),
         ]
 
-        # Mock calculate_scores to check if it's called
-        self.module.calculate_scores = MagicMock()
-
         # Run the finalization task
         result = finalize_swiss_module_internal(self.module)
 
@@ -104,17 +152,16 @@ class FinalizeSwissModuleTest(TestCase):
         mock_parse_swiss.assert_called_once_with("<html>dummy html</html>")
 
         # 2. Verify SwissResult objects were created
-        self.assertEqual(SwissResult.objects.count(), 2)
-        result_t1 = SwissResult.objects.get(team=self.team1)
-        result_t2 = SwissResult.objects.get(team=self.team2)
-        self.assertEqual(result_t1.score, self.module_score_3_0)
-        self.assertEqual(result_t2.score, self.module_score_2_1)
+        self.assertEqual(self._result_scores(), {
+            self.team1.id: self.module_score_3_0.id,
+            self.team2.id: self.module_score_2_1.id,
+        })
 
         # 3. Verify scores were calculated
-        self.module.calculate_scores.assert_called_once()
+        self.mock_calculate_scores.assert_called_once()
 
         # 4. Verify module is marked as completed
-        self.module.refresh_from_db()
+        self.module.refresh_from_db(fields=["is_completed", "finalized_at"])
         self.assertTrue(self.module.is_completed)
         self.assertIsNotNone(self.module.finalized_at)
 
@@ -122,8 +169,8 @@ class FinalizeSwissModuleTest(TestCase):
         self.assertEqual(result["status"], "success")
         self.assertEqual(result["module_id"], self.module.id)
 
-    @patch("fantasy.services.hltv_parser.parse_swiss")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_swiss")
+    @patch.object(Fetcher, "fetch")
     def test_finalization_updates_existing_results(self, mock_fetch, mock_parse_swiss):
         """Test that existing SwissResult objects are updated, not duplicated."""
         # Pre-create an incorrect result for Team A
@@ -138,17 +185,15 @@ class FinalizeSwissModuleTest(TestCase):
             ResultRow(team_hltv_id=101, record="3-0"),  # Corrected record
             ResultRow(team_hltv_id=102, record="2-1"),  # New record
         ]
-        self.module.calculate_scores = MagicMock()
 
         # Run finalization
         finalize_swiss_module_internal(self.module)
 
-        # Verify there are still only 2 results (one updated, one created)
-        self.assertEqual(SwissResult.objects.count(), 2)
-
-        # Verify Team A's result was updated to the correct score
-        result_t1 = SwissResult.objects.get(team=self.team1)
-        self.assertEqual(result_t1.score, self.module_score_3_0)
+        # Still only 2 results: Team A's was updated, Team B's created
+        self.assertEqual(self._result_scores(), {
+            self.team1.id: self.module_score_3_0.id,
+            self.team2.id: self.module_score_2_1.id,
+        })
 
     def test_no_hltv_url(self):
         """Test that finalization fails if the tournament has no HLTV URL."""
@@ -161,8 +206,8 @@ class FinalizeSwissModuleTest(TestCase):
         self.assertEqual(result["reason"], "missing_url")
         self.assertFalse(self.module.is_completed)
 
-    @patch("fantasy.services.hltv_parser.parse_swiss")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_swiss")
+    @patch.object(Fetcher, "fetch")
     def test_mismatched_data_is_skipped(self, mock_fetch, mock_parse_swiss):
         """
         Test that results for teams not in the module or records not in the
@@ -174,22 +219,52 @@ class FinalizeSwissModuleTest(TestCase):
             ResultRow(team_hltv_id=104, record="2-1"),  # Team D not in module
             ResultRow(team_hltv_id=102, record="0-3"),  # 0-3 score not in module
         ]
-        self.module.calculate_scores = MagicMock()
 
         with self.assertLogs('fantasy.tasks.module_finalization', level='WARNING') as cm:
             finalize_swiss_module_internal(self.module)
-            # Verify that warnings were logged for the skipped data
-            self.assertIn(f"Team with HLTV ID {104} found in parsed results", cm.output[0])
-            self.assertIn(f"Record '0-3' found in parsed results for team {self.team2.name}", cm.output[1])
+
+        # Verify that warnings were logged for the skipped data
+        messages = [record.getMessage() for record in cm.records]
+        self.assertTrue(any(
+            f"Team with HLTV ID {104} found in parsed results" in m for m in messages
+        ))
+        self.assertTrue(any(
+            f"Record '0-3' found in parsed results for team {self.team2.name}" in m
+            for m in messages
+        ))
 
         # Only one result should have been created (for Team A)
-        self.assertEqual(SwissResult.objects.count(), 1)
-        self.assertTrue(SwissResult.objects.filter(team=self.team1).exists())
-        self.module.calculate_scores.assert_called_once()
-        self.module.refresh_from_db()
+        self.assertEqual(
+            self._result_scores(), {self.team1.id: self.module_score_3_0.id}
+        )
+        self.mock_calculate_scores.assert_called_once()
+        self.module.refresh_from_db(fields=["is_completed"])
         self.assertTrue(self.module.is_completed)
 
-    @patch("fantasy.tasks.module_finalization.get_module_handler")
+
+class FinalizeModuleDispatchTest(SimpleTestCase):
+    """Branch logic of finalize_module, with the ORM lookups mocked out."""
+
+    def setUp(self):
+        self.module = MagicMock(spec=SwissModule)
+        self.module.id = 1
+        self.module.is_completed = False
+        self.module.end_date = timezone.now() - timezone.timedelta(days=1)
+
+        content_type = MagicMock(model="swissmodule")
+        manager = content_type.model_class.return_value._base_manager
+        manager.select_related.return_value.get.return_value = self.module
+
+        patcher = patch.object(module_finalization, "ContentType")
+        self.mock_content_type = patcher.start()
+        self.mock_content_type.objects.get_for_id.return_value = content_type
+        self.addCleanup(patcher.stop)
+
+        patcher = patch("fantasy.services.notifications.notification_service")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(module_finalization, "get_module_handler")
     def test_generic_finalize_module_dispatcher(self, mock_get_handler):
         """Test that the main finalize_module function dispatches correctly."""
         # Set up mock handler
@@ -197,74 +272,70 @@ class FinalizeSwissModuleTest(TestCase):
         mock_handler.return_value = {"status": "success_from_mock"}
         mock_get_handler.return_value = mock_handler
 
-        ct = ContentType.objects.get_for_model(self.module)
-        result = finalize_module(ct.id, self.module.id)
+        result = finalize_module(42, self.module.id)
 
         # Verify handler was called and result is passed through
+        self.mock_content_type.objects.get_for_id.assert_called_once_with(42)
         mock_get_handler.assert_called_once_with("swissmodule")
         mock_handler.assert_called_once_with(self.module)
         self.assertEqual(result, {"status": "success_from_mock"})
 
-    def test_finalize_module_already_completed(self):
+    @patch.object(module_finalization, "get_module_handler")
+    def test_finalize_module_already_completed(self, mock_get_handler):
         """Test that already completed modules are skipped."""
         self.module.is_completed = True
-        self.module.save()
 
-        ct = ContentType.objects.get_for_model(self.module)
-        result = finalize_module(ct.id, self.module.id)
+        result = finalize_module(42, self.module.id)
 
         self.assertEqual(result["status"], "skipped")
         self.assertEqual(result["reason"], "already_completed")
+        mock_get_handler.assert_not_called()
 
-    def test_finalize_module_not_ended(self):
+    @patch.object(module_finalization, "get_module_handler")
+    def test_finalize_module_not_ended(self, mock_get_handler):
         """Test that modules that haven't ended are skipped."""
         self.module.end_date = timezone.now() + timezone.timedelta(days=1)
-        self.module.save()
 
-        ct = ContentType.objects.get_for_model(self.module)
-        result = finalize_module(ct.id, self.module.id)
+        result = finalize_module(42, self.module.id)
 
         self.assertEqual(result["status"], "skipped")
         self.assertEqual(result["reason"], "not_ended")
+        mock_get_handler.assert_not_called()
 
 
-class FinalizeBracketModuleTest(TestCase):
-    def setUp(self):
+class FinalizeBracketModuleTest(_TournamentFixtureMixin, TestCase):
+    stage_name = "Playoffs"
+    create_teams = True
+
+    @classmethod
+    def setUpTestData(cls):
         """Set up a tournament and a Bracket module with matches."""
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
-            hltv_url="http://fake-hltv-url.com/event/123",
-        )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Playoffs",
-            order=1,
-        )
-        self.module = Bracket.objects.create(
+        super().setUpTestData()
+        cls.module = Bracket.objects.create(
             name="Test Bracket",
-            tournament=self.tournament,
-            stage=self.stage,
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
+            tournament=cls.tournament,
+            stage=cls.stage,
+            start_date=cls.now - timezone.timedelta(days=10),
+            end_date=cls.now - timezone.timedelta(days=1),
         )
 
-        # Create teams
-        self.team1 = Team.objects.create(name="Team A", hltv_id=101)
-        self.team2 = Team.objects.create(name="Team B", hltv_id=102)
-
         # Create bracket matches with hltv_match_id
-        self.match1 = BracketMatch.objects.create(
-            bracket=self.module,
+        cls.match1 = BracketMatch.objects.create(
+            bracket=cls.module,
             round=1,
-            team_a=self.team1,
-            team_b=self.team2,
+            team_a=cls.team1,
+            team_b=cls.team2,
             hltv_match_id=9001,
         )
 
-    @patch("fantasy.services.hltv_parser.parse_brackets")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    def setUp(self):
+        # Score calculation has its own tests; just check it gets triggered
+        patcher = patch.object(self.module, "calculate_scores")
+        self.mock_calculate_scores = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(hltv_parser, "parse_brackets")
+    @patch.object(Fetcher, "fetch")
     def test_successful_bracket_finalization(self, mock_fetch, mock_parse_brackets):
         """Test a full, successful bracket finalization flow."""
         mock_fetch.return_value = "<html>dummy html</html>"
@@ -286,25 +357,23 @@ class FinalizeBracketModuleTest(TestCase):
             )
         ]
 
-        self.module.calculate_scores = MagicMock()
-
         result = finalize_bracket_module_internal(self.module)
 
         # Verify match was updated
-        self.match1.refresh_from_db()
+        self.match1.refresh_from_db(fields=["team_a_score", "team_b_score", "winner"])
         self.assertEqual(self.match1.team_a_score, 2)
         self.assertEqual(self.match1.team_b_score, 1)
         self.assertEqual(self.match1.winner, self.team1)
 
         # Verify module is completed
-        self.module.refresh_from_db()
+        self.module.refresh_from_db(fields=["is_completed", "finalized_at"])
         self.assertTrue(self.module.is_completed)
         self.assertIsNotNone(self.module.finalized_at)
         self.assertEqual(result["status"], "success")
         self.assertEqual(result["matches_updated"], 1)
 
-    @patch("fantasy.services.hltv_parser.parse_brackets")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_brackets")
+    @patch.object(Fetcher, "fetch")
     def test_bracket_finalization_missing_match(self, mock_fetch, mock_parse_brackets):
         """Test that unmatched parsed results are skipped."""
         mock_fetch.return_value = "<html></html>"
@@ -326,11 +395,10 @@ class FinalizeBracketModuleTest(TestCase):
             )
         ]
 
-        self.module.calculate_scores = MagicMock()
         result = finalize_bracket_module_internal(self.module)
 
         # Match should not be updated
-        self.match1.refresh_from_db()
+        self.match1.refresh_from_db(fields=["winner"])
         self.assertIsNone(self.match1.winner)
         self.assertEqual(result["matches_updated"], 0)
 
@@ -345,42 +413,41 @@ class FinalizeBracketModuleTest(TestCase):
         self.assertEqual(result["reason"], "missing_url")
 
 
-class FinalizeStatsModuleTest(TestCase):
-    def setUp(self):
+class FinalizeStatsModuleTest(_TournamentFixtureMixin, TestCase):
+    stage_name = "Stats Stage"
+
+    @classmethod
+    def setUpTestData(cls):
         """Set up a tournament and StatPredictions module with definitions."""
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
-            hltv_url="http://fake-hltv-url.com/event/123",
-        )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Stats Stage",
-            order=1,
-        )
-        self.module = StatPredictionsModule.objects.create(
+        super().setUpTestData()
+        cls.module = StatPredictionsModule.objects.create(
             name="Test Stats Module",
-            tournament=self.tournament,
-            stage=self.stage,
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() - timezone.timedelta(days=1),
+            tournament=cls.tournament,
+            stage=cls.stage,
+            start_date=cls.now - timezone.timedelta(days=10),
+            end_date=cls.now - timezone.timedelta(days=1),
         )
 
         # Create category and definition
-        self.category = StatPredictionCategory.objects.create(
+        cls.category = StatPredictionCategory.objects.create(
             name="MVP",
             url_template="https://www.hltv.org/stats/players?event={event_id}"
         )
-        self.definition = StatPredictionDefinition.objects.create(
-            module=self.module,
-            category=self.category,
+        cls.definition = StatPredictionDefinition.objects.create(
+            module=cls.module,
+            category=cls.category,
             title="Tournament MVP",
             source_url="https://www.hltv.org/stats/players?event=123",
         )
 
-    @patch("fantasy.services.hltv_parser.parse_leaderboard")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    def setUp(self):
+        # Score calculation has its own tests; just check it gets triggered
+        patcher = patch.object(self.module, "calculate_scores")
+        self.mock_calculate_scores = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(hltv_parser, "parse_leaderboard")
+    @patch.object(Fetcher, "fetch")
     def test_successful_stats_finalization(self, mock_fetch, mock_parse_leaderboard):
         """Test a full, successful stats finalization flow."""
         mock_fetch.return_value = "<html>dummy html</html>"
@@ -389,8 +456,6 @@ class FinalizeStatsModuleTest(TestCase):
             LeaderboardEntry(hltv_id=1002, name="Player2", value=1.28, position=2),
         ]
 
-        self.module.calculate_scores = MagicMock()
-
         result = finalize_stats_module_internal(self.module)
 
         # Verify StatPredictionResult was created
@@ -402,20 +467,18 @@ class FinalizeStatsModuleTest(TestCase):
         self.assertEqual(stat_result.results[0]["position"], 1)
 
         # Verify module is completed
-        self.module.refresh_from_db()
+        self.module.refresh_from_db(fields=["is_completed"])
         self.assertTrue(self.module.is_completed)
         self.assertEqual(result["status"], "success")
         self.assertEqual(result["definitions_processed"], 1)
 
-    @patch("fantasy.services.hltv_parser.parse_leaderboard")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_leaderboard")
+    @patch.object(Fetcher, "fetch")
     def test_stats_finalization_no_source_url(self, mock_fetch, mock_parse_leaderboard):
         """Test that definitions without source_url are skipped."""
         self.definition.source_url = None
         self.definition.save()
 
-        self.module.calculate_scores = MagicMock()
-
         with self.assertLogs('fantasy.tasks.module_finalization', level='WARNING'):
             result = finalize_stats_module_internal(self.module)
 
@@ -424,8 +487,8 @@ class FinalizeStatsModuleTest(TestCase):
         self.assertEqual(result["definitions_skipped"], 1)
         self.assertEqual(result["definitions_processed"], 0)
 
-    @patch("fantasy.services.hltv_parser.parse_leaderboard")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_leaderboard")
+    @patch.object(Fetcher, "fetch")
     def test_stats_finalization_updates_existing_result(self, mock_fetch, mock_parse_leaderboard):
         """Test that existing results are updated."""
         # Pre-create a result
@@ -440,8 +503,17 @@ class FinalizeStatsModuleTest(TestCase):
             LeaderboardEntry(hltv_id=1001, name="Player1", value=1.35, position=1),
         ]
 
-        self.module.calculate_scores = MagicMock()
-        finalize_stats_module_internal(self.module)
+        with CaptureQueriesContext(connection) as ctx:
+            finalize_stats_module_internal(self.module)
+
+        # The existing row is upserted in place, not re-read and saved
+        result_table = StatPredictionResult._meta.db_table
+        writes = [
+            q["sql"] for q in ctx.captured_queries
+            if result_table in q["sql"] and not q["sql"].startswith("SELECT")
+        ]
+        self.assertEqual(len(writes), 1)
+        self.assertIn("ON CONFLICT", writes[0])
 
         # Should still be only 1 result, but updated
         self.assertEqual(StatPredictionResult.objects.count(), 1)
@@ -449,35 +521,76 @@ class FinalizeStatsModuleTest(TestCase):
         self.assertEqual(stat_result.results[0]["hltv_id"], 1001)
         self.assertTrue(stat_result.is_final)
 
+    @patch.object(hltv_parser, "parse_leaderboard")
+    @patch.object(Fetcher, "fetch")
+    def test_stats_finalization_inverts_results(self, mock_fetch, mock_parse_leaderboard):
+        """Test that invert_results definitions store the leaderboard reversed."""
+        self.definition.invert_results = True
+        self.definition.save()
 
-class PopulateStageModulesTest(TestCase):
-    def setUp(self):
-        """Set up tournament, stages, and modules for population tests."""
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now() - timezone.timedelta(days=10),
-            end_date=timezone.now() + timezone.timedelta(days=10),
-            hltv_url="http://fake-hltv-url.com/event/123",
+        mock_fetch.return_value = "<html></html>"
+        mock_parse_leaderboard.return_value = [
+            LeaderboardEntry(hltv_id=1001, name="Player1", value=0.5, position=1),
+            LeaderboardEntry(hltv_id=1002, name="Player2", value=0.7, position=2),
+        ]
+
+        finalize_stats_module_internal(self.module)
+
+        stat_result = StatPredictionResult.objects.get(definition=self.definition)
+        self.assertEqual([r["hltv_id"] for r in stat_result.results], [1002, 1001])
+
+    @patch.object(hltv_parser, "parse_leaderboard")
+    @patch.object(Fetcher, "fetch")
+    def test_stats_finalization_multiple_definitions(self, mock_fetch, mock_parse_leaderboard):
+        """Test that every definition gets its own fetched leaderboard."""
+        second = StatPredictionDefinition.objects.create(
+            module=self.module,
+            category=self.category,
+            title="Top Rifler",
+            source_url="https://www.hltv.org/stats/players?event=456",
         )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Group Stage",
-            order=1,
+
+        mock_fetch.side_effect = lambda url, module=None: url
+        mock_parse_leaderboard.side_effect = lambda html: [
+            LeaderboardEntry(
+                hltv_id=1001 if html.endswith("123") else 1002,
+                name="Player",
+                value=1.0,
+                position=1,
+            )
+        ]
+
+        result = finalize_stats_module_internal(self.module)
+
+        self.assertEqual(result["definitions_processed"], 2)
+        self.assertEqual(
+            StatPredictionResult.objects.get(definition=self.definition).results[0]["hltv_id"],
+            1001,
         )
-        self.swiss_module = SwissModule.objects.create(
-            name="Swiss Round",
-            tournament=self.tournament,
-            stage=self.stage,
-            start_date=timezone.now() - timezone.timedelta(days=5),
-            end_date=timezone.now() + timezone.timedelta(days=5),
+        self.assertEqual(
+            StatPredictionResult.objects.get(definition=second).results[0]["hltv_id"],
+            1002,
         )
 
-        # Create teams
-        self.team1 = Team.objects.create(name="Team A", hltv_id=101)
-        self.team2 = Team.objects.create(name="Team B", hltv_id=102)
 
-    @patch("fantasy.services.hltv_parser.parse_teams_attending")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+class PopulateStageModulesTest(_TournamentFixtureMixin, TestCase):
+    tournament_end = timezone.timedelta(days=10)
+    create_teams = True
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up tournament, stages, and modules for population tests."""
+        super().setUpTestData()
+        cls.swiss_module = SwissModule.objects.create(
+            name="Swiss Round",
+            tournament=cls.tournament,
+            stage=cls.stage,
+            start_date=cls.now - timezone.timedelta(days=5),
+            end_date=cls.now + timezone.timedelta(days=5),
+        )
+
+    @patch.object(hltv_parser, "parse_teams_attending")
+    @patch.object(Fetcher, "fetch")
     def test_populate_stage_modules_success(self, mock_fetch, mock_parse_teams):
         """Test successful population of stage modules."""
         mock_fetch.return_value = "<html>dummy</html>"
@@ -495,19 +608,8 @@ class PopulateStageModulesTest(TestCase):
         self.assertEqual(result["modules_populated"], 1)
 
         # Verify teams were set on module
-        self.swiss_module.refresh_from_db()
         self.assertEqual(self.swiss_module.teams.count(), 2)
 
-    def test_populate_stage_modules_missing_url(self):
-        """Test population fails when no HLTV URL is available."""
-        # Use update to bypass URLField validation for empty string
-        Tournament.objects.filter(pk=self.tournament.pk).update(hltv_url="")
-
-        result = populate_stage_modules(self.stage.id)
-
-        self.assertEqual(result["status"], "error")
-        self.assertEqual(result["reason"], "missing_url")
-
     def test_populate_stage_modules_stage_not_found(self):
         """Test population handles missing stage gracefully."""
         result = populate_stage_modules(99999)
@@ -515,9 +617,9 @@ class PopulateStageModulesTest(TestCase):
         self.assertEqual(result["status"], "error")
         self.assertEqual(result["reason"], "stage_not_found")
 
-    @patch("fantasy.tasks.module_finalization._schedule_population_retry")
-    @patch("fantasy.services.hltv_parser.parse_teams_attending")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(module_finalization, "_schedule_population_retry")
+    @patch.object(hltv_parser, "parse_teams_attending")
+    @patch.object(Fetcher, "fetch")
     def test_populate_stage_modules_schedules_retry(self, mock_fetch, mock_parse_teams, mock_schedule):
         """Test that incomplete data triggers retry scheduling."""
         mock_fetch.return_value = "<html></html>"
@@ -533,8 +635,8 @@ class PopulateStageModulesTest(TestCase):
             self.stage.id, 1, POPULATION_RETRY_DELAYS[0]
         )
 
-    @patch("fantasy.services.hltv_parser.parse_teams_attending")
-    @patch("fantasy.services.fetcher.Fetcher.fetch")
+    @patch.object(hltv_parser, "parse_teams_attending")
+    @patch.object(Fetcher, "fetch")
     def test_populate_stage_modules_max_retries(self, mock_fetch, mock_parse_teams):
         """Test that max retries returns error status."""
         mock_fetch.return_value = "<html></html>"
@@ -556,15 +658,15 @@ class PopulateStageModulesTest(TestCase):
             name="Bracket",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
         stats_module = StatPredictionsModule.objects.create(
             name="Stats",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         from fantasy.models.core import BaseModule
@@ -577,39 +679,50 @@ class PopulateStageModulesTest(TestCase):
         self.assertIn("players", needs)
 
 
+class PopulateStageModulesMissingUrlTest(SimpleTestCase):
+    @patch.object(module_finalization, "fetcher")
+    @patch.object(module_finalization, "Stage")
+    def test_populate_stage_modules_missing_url(self, mock_stage, mock_fetcher):
+        """Test population fails when no HLTV URL is available."""
+        stage = MagicMock(id=1, hltv_url="", tournament=MagicMock(hltv_url=""))
+        mock_stage.objects.select_related.return_value.get.return_value = stage
+
+        result = populate_stage_modules(stage.id)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["reason"], "missing_url")
+        mock_stage.objects.select_related.assert_called_once_with("tournament")
+        mock_fetcher.fetch.assert_not_called()
+
+
 class SchedulePopulationRetryTest(TestCase):
     def test_schedule_population_retry_creates_schedule(self):
         """Test that retry creates a Django-Q Schedule."""
         from django_q.models import Schedule
 
-        initial_count = Schedule.objects.count()
-
         _schedule_population_retry(stage_id=1, attempt=2, delay_minutes=60)
 
-        self.assertEqual(Schedule.objects.count(), initial_count + 1)
-        schedule = Schedule.objects.last()
+        schedule = Schedule.objects.get(name="populate_stage_1_retry")
         self.assertEqual(schedule.func, "fantasy.tasks.populate_stage_modules")
         self.assertEqual(schedule.args, "1,2")
         self.assertEqual(schedule.schedule_type, Schedule.ONCE)
 
+    def test_schedule_population_retry_reuses_schedule(self):
+        """Test that later retries reschedule the same row."""
+        from django_q.models import Schedule
+
+        _schedule_population_retry(stage_id=1, attempt=1, delay_minutes=60)
+        _schedule_population_retry(stage_id=1, attempt=2, delay_minutes=120)
+
+        schedules = Schedule.objects.filter(name="populate_stage_1_retry")
+        self.assertEqual(schedules.count(), 1)
+        self.assertEqual(schedules.get().args, "1,2")
 
-class PopulationHandlersTest(TestCase):
-    def setUp(self):
-        """Set up common test data."""
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=10),
-        )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Group Stage",
-            order=1,
-        )
 
-        # Create teams
-        self.team1 = Team.objects.create(name="Team A", hltv_id=101)
-        self.team2 = Team.objects.create(name="Team B", hltv_id=102)
+class PopulationHandlersTest(_TournamentFixtureMixin, TestCase):
+    tournament_end = timezone.timedelta(days=10)
+    tournament_hltv_url = None
+    create_teams = True
 
     def test_populate_swiss_module_success(self):
         """Test Swiss module population with teams."""
@@ -617,8 +730,8 @@ class PopulationHandlersTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         parsed_data = {
@@ -635,7 +748,11 @@ class PopulationHandlersTest(TestCase):
         self.assertEqual(module.teams.count(), 2)
 
         # Verify default scores were created
-        self.assertTrue(module.scores.exists())
+        self.assertEqual(module.scores.count(), 6)
+        three_one = module.scores.get(score__wins=3, score__losses=1).score
+        self.assertEqual(
+            list(three_one.groups.values_list("name", flat=True)), ["Qualified"]
+        )
 
     def test_populate_swiss_module_no_teams(self):
         """Test Swiss population with no teams returns incomplete."""
@@ -643,8 +760,8 @@ class PopulationHandlersTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         result = populate_swiss_module(module, {"teams": []})
@@ -658,8 +775,8 @@ class PopulationHandlersTest(TestCase):
             name="Bracket",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
         match = BracketMatch.objects.create(
             bracket=module,
@@ -693,7 +810,7 @@ class PopulationHandlersTest(TestCase):
         self.assertEqual(result["matches_updated"], 1)
         self.assertEqual(result.get("matches_created", 0), 0)
 
-        match.refresh_from_db()
+        match.refresh_from_db(fields=["team_a", "team_b"])
         self.assertEqual(match.team_a, self.team1)
         self.assertEqual(match.team_b, self.team2)
 
@@ -703,8 +820,8 @@ class PopulationHandlersTest(TestCase):
             name="Bracket",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         # No matches exist initially
@@ -739,12 +856,21 @@ class PopulationHandlersTest(TestCase):
             ]
         }
 
-        result = populate_bracket_module(module, parsed_data)
+        with CaptureQueriesContext(connection) as ctx:
+            result = populate_bracket_module(module, parsed_data)
 
         self.assertEqual(result["status"], "success")
         self.assertEqual(result["matches_created"], 2)
         self.assertEqual(module.matches.count(), 2)
 
+        # All new matches go in with one INSERT, not one per row
+        match_table = BracketMatch._meta.db_table
+        inserts = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT") and match_table in q["sql"]
+        ]
+        self.assertEqual(len(inserts), 1)
+
         # Check first match has teams set
         match1 = module.matches.get(hltv_match_id=9001)
         self.assertEqual(match1.team_a, self.team1)
@@ -763,8 +889,8 @@ class PopulationHandlersTest(TestCase):
             name="Bracket",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         result = populate_bracket_module(module, {"brackets": []})
@@ -778,8 +904,8 @@ class PopulationHandlersTest(TestCase):
             name="Stats",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         parsed_data = {
@@ -802,8 +928,8 @@ class PopulationHandlersTest(TestCase):
             name="Stats",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         result = populate_stat_predictions_module(module, {"players": [], "teams": []})
@@ -822,8 +948,8 @@ class PopulationHandlersTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
         swiss_module.teams.set([self.team1, self.team2])
 
@@ -832,8 +958,8 @@ class PopulationHandlersTest(TestCase):
             name="Stats",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         # Create a category and definition
@@ -887,8 +1013,8 @@ class PopulationHandlersTest(TestCase):
             name="Stats",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         # Parse data includes players from teams
@@ -910,25 +1036,45 @@ class PopulationHandlersTest(TestCase):
         self.assertEqual(result["players_created"], 2)
         self.assertEqual(Player.objects.count(), 2)
 
+    def test_populate_stat_predictions_module_updates_renamed(self):
+        """Test StatPredictions population renames existing teams and players."""
+        Team.objects.create(hltv_id=501, name="Old Team")
+        Player.objects.create(hltv_id=5001, name="OldName")
+        stats_module = StatPredictionsModule.objects.create(
+            name="Stats",
+            tournament=self.tournament,
+            stage=self.stage,
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
+        )
+
+        parsed_data = {
+            "players": [
+                ParsedPlayer(hltv_id=5001, name="NewName", team_hltv_id=501),
+                ParsedPlayer(hltv_id=5002, name="Player2", team_hltv_id=501),
+            ],
+            "teams": [ParsedTeam(hltv_id=501, name="New Team")],
+        }
+
+        result = populate_stat_predictions_module(stats_module, parsed_data)
+
+        self.assertEqual(result["teams_updated"], 1)
+        self.assertEqual(result["players_updated"], 1)
+        self.assertEqual(result["players_created"], 1)
+        self.assertEqual(Team.objects.get(hltv_id=501).name, "New Team")
+        self.assertEqual(Player.objects.get(hltv_id=5001).name, "NewName")
+
 
-class ModuleSchedulingTest(TestCase):
+class ModuleSchedulingTest(_TournamentFixtureMixin, TestCase):
     """Test that modules properly schedule finalization tasks on save."""
 
+    tournament_end = timezone.timedelta(days=10)
+    tournament_hltv_url = None
+
     def setUp(self):
         from django_q.models import Schedule
         self.Schedule = Schedule
 
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=10),
-        )
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
-            name="Group Stage",
-            order=1,
-        )
-
     def test_module_save_creates_schedule(self):
         """Test that saving a module with end_date creates a finalization schedule."""
         initial_count = self.Schedule.objects.count()
@@ -937,8 +1083,8 @@ class ModuleSchedulingTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         self.assertEqual(self.Schedule.objects.count(), initial_count + 1)
@@ -952,15 +1098,15 @@ class ModuleSchedulingTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         initial_count = self.Schedule.objects.count()
         old_next_run = self.Schedule.objects.last().next_run
 
         # Update end_date
-        module.end_date = timezone.now() + timezone.timedelta(days=2)
+        module.end_date = self.now + timezone.timedelta(days=2)
         module.save()
 
         # Should still have same count (updated, not created)
@@ -974,8 +1120,8 @@ class ModuleSchedulingTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=1),
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=1),
         )
 
         initial_count = self.Schedule.objects.count()
@@ -991,35 +1137,50 @@ class ModuleSchedulingTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage,
-            start_date=timezone.now(),
+            start_date=self.now,
             end_date=None,
         )
 
         self.assertEqual(self.Schedule.objects.count(), initial_count)
 
+    def test_module_save_schedules_deadline_reminders(self):
+        """Test that reminders are scheduled once per window with parseable args."""
+        import ast
 
-class StageAdvancementTest(TestCase):
-    """Test stage advancement logic when blocking modules complete."""
-
-    def setUp(self):
-        self.tournament = Tournament.objects.create(
-            name="Test Tournament",
-            start_date=timezone.now(),
-            end_date=timezone.now() + timezone.timedelta(days=10),
-            hltv_url="http://fake-url.com/event/123",
-        )
-        self.stage1 = Stage.objects.create(
+        module = SwissModule.objects.create(
+            name="Swiss",
             tournament=self.tournament,
-            name="Group Stage",
-            order=1,
+            stage=self.stage,
+            start_date=self.now,
+            end_date=self.now + timezone.timedelta(days=3),
+            prediction_deadline=self.now + timezone.timedelta(days=2),
         )
-        self.stage2 = Stage.objects.create(
-            tournament=self.tournament,
+        module.save()
+
+        reminders = self.Schedule.objects.filter(
+            name__startswith=f"deadline_reminder_{module.id}_"
+        )
+        self.assertEqual(reminders.count(), 3)
+        args = {ast.literal_eval(r.args) for r in reminders}
+        self.assertIn((module.id, "24 hours"), args)
+
+
+class StageAdvancementTest(_TournamentFixtureMixin, TestCase):
+    """Test stage advancement logic when blocking modules complete."""
+
+    tournament_end = timezone.timedelta(days=10)
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.stage1 = cls.stage
+        cls.stage2 = Stage.objects.create(
+            tournament=cls.tournament,
             name="Playoffs",
             order=2,
         )
-        self.stage1.next_stage = self.stage2
-        self.stage1.save()
+        cls.stage1.next_stage = cls.stage2
+        cls.stage1.save()
 
     @patch("django_q.tasks.async_task")
     def test_stage_advancement_triggers_population(self, mock_async_task):
@@ -1028,14 +1189,14 @@ class StageAdvancementTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=True,
         )
 
         # Mark as completed (simulating finalization)
         module.is_completed = True
-        module.finalized_at = timezone.now()
+        module.finalized_at = self.now
         module.save()
 
         # Should trigger population of next stage
@@ -1051,22 +1212,22 @@ class StageAdvancementTest(TestCase):
             name="Swiss 1",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=True,
         )
         module2 = SwissModule.objects.create(
             name="Swiss 2",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=True,
         )
 
         # Complete first module
         module1.is_completed = True
-        module1.finalized_at = timezone.now()
+        module1.finalized_at = self.now
         module1.save()
 
         # Should NOT trigger yet
@@ -1074,7 +1235,7 @@ class StageAdvancementTest(TestCase):
 
         # Complete second module
         module2.is_completed = True
-        module2.finalized_at = timezone.now()
+        module2.finalized_at = self.now
         module2.save()
 
         # NOW should trigger
@@ -1090,22 +1251,22 @@ class StageAdvancementTest(TestCase):
             name="Blocking",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=True,
         )
         non_blocking = SwissModule.objects.create(
             name="Non-blocking",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=False,
         )
 
         # Complete only blocking module
         blocking.is_completed = True
-        blocking.finalized_at = timezone.now()
+        blocking.finalized_at = self.now
         blocking.save()
 
         # Should trigger (non-blocking is ignored)
@@ -1125,13 +1286,13 @@ class StageAdvancementTest(TestCase):
             name="Swiss",
             tournament=self.tournament,
             stage=self.stage1,
-            start_date=timezone.now() - timezone.timedelta(days=1),
-            end_date=timezone.now() - timezone.timedelta(hours=1),
+            start_date=self.now - timezone.timedelta(days=1),
+            end_date=self.now - timezone.timedelta(hours=1),
             blocking_advancement=True,
         )
 
         module.is_completed = True
-        module.finalized_at = timezone.now()
+        module.finalized_at = self.now
         module.save()
 
         # Should NOT trigger (no next stage)
@@ -0,0 +1,214 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from fantasy.models import (
+    NotificationChannel,
+    NotificationLog,
+    NotificationType,
+    User,
+    UserNotificationPreference,
+    UserNotificationSettings,
+)
+from fantasy.services import notifications
+
+
+class _NotificationFixtureMixin:
+    """
+    Creates one notification type, two channels and two users once per
+    class. Neither user has settings rows; tests add the ones they need.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.notification_type = NotificationType.objects.create(
+            name="Test notification", tag="test_notification"
+        )
+        cls.channel = NotificationChannel.objects.create(
+            name="Test channel", tag="test-channel"
+        )
+        cls.other_channel = NotificationChannel.objects.create(
+            name="Other channel", tag="other-channel"
+        )
+        cls.alice = User.objects.create_user(
+            email="alice@example.com", username="alice"
+        )
+        cls.bob = User.objects.create_user(email="bob@example.com", username="bob")
+        UserNotificationSettings.objects.filter(user__in=[cls.alice, cls.bob]).delete()
+
+    @classmethod
+    def _enable(cls, user, *channels):
+        UserNotificationSettings.objects.get_or_create(user=user)
+        for channel in channels:
+            UserNotificationPreference.objects.create(
+                user=user, notification_type=cls.notification_type, channel=channel
+            )
+
+
+class EnabledChannelsByUserTest(_NotificationFixtureMixin, TestCase):
+    def test_resolves_channels_for_all_users(self):
+        self._enable(self.alice, self.channel)
+
+        channels = UserNotificationSettings.get_enabled_channels_by_user(
+            [self.alice, self.bob], self.notification_type
+        )
+
+        self.assertEqual(
+            channels, {self.alice.pk: ["test-channel"], self.bob.pk: []}
+        )
+
+    def test_creates_default_settings_for_users_without_them(self):
+        channels = UserNotificationSettings.get_enabled_channels_by_user(
+            [self.bob], self.notification_type
+        )
+
+        self.assertEqual(channels, {self.bob.pk: []})
+        settings = UserNotificationSettings.objects.get(user=self.bob)
+        self.assertTrue(settings.notifications_enabled)
+
+    def test_disabled_users_are_left_out(self):
+        self._enable(self.alice, self.channel)
+        UserNotificationSettings.objects.filter(user=self.alice).update(
+            notifications_enabled=False
+        )
+
+        channels = UserNotificationSettings.get_enabled_channels_by_user(
+            [self.alice], self.notification_type
+        )
+
+        self.assertEqual(channels, {})
+
+
+class SendBatchForChannelsTest(_NotificationFixtureMixin, TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            notifications.notification_service,
+            "_send_to_apprise_api",
+            return_value=True,
+        )
+        self.mock_send = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_logs_one_row_per_delivered_user(self):
+        result = notifications._send_batch_for_channels(
+            self.notification_type.id,
+            "Title",
+            "Message",
+            ["test-channel"],
+            [self.alice.uuid, self.bob.uuid],
+        )
+
+        self.assertEqual(result["status"], "completed")
+        self.mock_send.assert_called_once_with("Title", "Message", ["test-channel"])
+        logs = NotificationLog.objects.filter(notification_type=self.notification_type)
+        self.assertCountEqual(
+            logs.values_list("recipient_user_id", flat=True),
+            [self.alice.pk, self.bob.pk],
+        )
+        for log in logs:
+            self.assertTrue(log.success)
+            self.assertEqual(log.recipient_type, "user")
+
+    def test_unknown_user_ids_are_skipped(self):
+        with self.assertLogs(notifications.logger, level="ERROR"):
+            notifications._send_batch_for_channels(
+                self.notification_type.id,
+                "Title",
+                "Message",
+                ["test-channel"],
+                [str(self.alice.uuid), str(uuid.uuid4())],
+            )
+
+        self.assertEqual(
+            list(NotificationLog.objects.values_list("recipient_user_id", flat=True)),
+            [self.alice.pk],
+        )
+
+
+class SendToAllUsersTest(_NotificationFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.carol = User.objects.create_user(
+            email="carol@example.com", username="carol"
+        )
+        UserNotificationSettings.objects.filter(user=cls.carol).delete()
+        cls._enable(cls.alice, cls.channel)
+        cls._enable(cls.bob, cls.other_channel, cls.channel)
+        cls._enable(cls.carol, cls.channel)
+
+    def setUp(self):
+        patcher = patch("django_q.tasks.async_task", return_value="task-id")
+        self.mock_async_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_recipients_returns_early(self):
+        NotificationType.objects.create(
+            name="Admin only", tag="test_admin_only", is_admin_only=True
+        )
+
+        result = notifications.notification_service.send_to_all_users(
+            "test_admin_only", "Title", "Message"
+        )
+
+        self.assertEqual(result, {"status": "success", "message": "No recipients"})
+        self.mock_async_task.assert_not_called()
+
+    def test_queues_planner(self):
+        result = notifications.notification_service.send_to_all_users(
+            "test_notification", "Title", "Message"
+        )
+
+        self.assertEqual(result, {"status": "queued_planner", "task_id": "task-id"})
+        self.mock_async_task.assert_called_once_with(
+            "fantasy.services.notifications._plan_and_dispatch",
+            self.notification_type.id,
+            "Title",
+            "Message",
+        )
+
+    def test_groups_users_by_channels_across_chunks(self):
+        users_by_channels = (
+            notifications.notification_service._group_users_by_channels(
+                self.notification_type, chunk_size=1
+            )
+        )
+
+        self.assertEqual(
+            set(users_by_channels),
+            {("test-channel",), ("other-channel", "test-channel")},
+        )
+        self.assertCountEqual(
+            users_by_channels[("test-channel",)], [self.alice.pk, self.carol.pk]
+        )
+        self.assertEqual(
+            users_by_channels[("other-channel", "test-channel")], [self.bob.pk]
+        )
+
+    def test_plan_and_dispatch_queues_one_batch_per_channel_group(self):
+        result = notifications._plan_and_dispatch(
+            self.notification_type.id, "Title", "Message"
+        )
+
+        self.assertEqual(result["status"], "queued")
+        self.assertEqual(result["batch_count"], 2)
+        batches = {}
+        for queued in self.mock_async_task.call_args_list:
+            func, type_id, title, message, tags, user_uuids = queued.args
+            self.assertEqual(
+                func, "fantasy.services.notifications._send_batch_for_channels"
+            )
+            self.assertEqual(
+                (type_id, title, message),
+                (self.notification_type.id, "Title", "Message"),
+            )
+            batches[tuple(tags)] = set(user_uuids)
+        self.assertEqual(
+            batches,
+            {
+                ("test-channel",): {self.alice.pk, self.carol.pk},
+                ("other-channel", "test-channel"): {self.bob.pk},
+            },
+        )
@@ -1,12 +1,15 @@
 import json
 from pathlib import Path
+from unittest.mock import patch
 from django.test import SimpleTestCase
+from fantasy.services import hltv_parser
 from fantasy.services.hltv_parser import (
     parse_swiss,
     parse_teams_attending,
     parse_leaderboard,
     parse_tournament_formats,
     parse_tournament_metadata,
+    parse_tournament_metadata_cached,
     Team,
     Player,
     ResultRow,
@@ -409,19 +412,51 @@ class TournamentFormatsParserTest(SimpleTestCase):
         stages = parse_tournament_formats(html)
         self.assertEqual(stages, [])
 
+    def test_parse_formats_nested_markup(self):
+        """Test rows with nested markup are still parsed"""
+        html = """
+        <table class="formats table">
+            <tr>
+                <th class="format-header">Group stage</th>
+                <td class="format-data">Swiss Bo3</td>
+            </tr>
+            <tr>
+                <th class="format-header"><span>Playoffs</span></th>
+                <td class="format-data">Single elimination <b>Bo5</b></td>
+            </tr>
+        </table>
+        """
+        stages = parse_tournament_formats(html)
+
+        self.assertEqual(len(stages), 2)
+        self.assertEqual(stages[1].name, "Playoffs")
+        self.assertEqual(stages[1].format_type, "bracket")
+        self.assertEqual(stages[1].best_of, 5)
+
 
 class TournamentMetadataParserTest(SimpleTestCase):
     """Test HLTV tournament metadata parser"""
 
-    def test_parse_metadata_from_fixture(self):
-        """Test parsing tournament metadata from stored HTML fixture."""
-        html_file_path = FIXTURES_DIR / "finished_swiss_tournament.html"
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Several tests need the full-page parse; do the slow part once
+        cls.swiss_html = (FIXTURES_DIR / "finished_swiss_tournament.html").read_text()
+        cls.swiss_metadata = parse_tournament_metadata(cls.swiss_html)
 
-        if not html_file_path.exists():
-            self.skipTest(f"Fixture not found at: {html_file_path}")
+    def test_parse_metadata_parses_page_once(self):
+        """Test every metadata section is read from a single parsed tree"""
+        with patch.object(
+            hltv_parser.lxml_html, "fromstring", wraps=hltv_parser.lxml_html.fromstring
+        ) as mock_fromstring:
+            metadata = parse_tournament_metadata(self.swiss_html)
 
-        html_content = html_file_path.read_text()
-        metadata = parse_tournament_metadata(html_content)
+        mock_fromstring.assert_called_once()
+        self.assertEqual(metadata, self.swiss_metadata)
+
+    def test_parse_metadata_from_fixture(self):
+        """Test parsing tournament metadata from stored HTML fixture."""
+        metadata = self.swiss_metadata
 
         # Print for verification
         print("\n" + "=" * 60)
@@ -460,3 +495,16 @@ class TournamentMetadataParserTest(SimpleTestCase):
         self.assertEqual(len(metadata["stages"]), 1)
         self.assertEqual(metadata["stages"][0].name, "Group stage")
         self.assertEqual(metadata["stage_count"], 1)
+
+    def test_parse_metadata_non_event_page(self):
+        """Test pages without event markers are treated as empty"""
+        html = "<html><body><div class='teams-attending grid'></div></body></html>"
+        self.assertEqual(parse_tournament_metadata(html), {})
+
+    def test_parse_metadata_cached_returns_independent_copies(self):
+        """Test cached metadata matches a fresh parse and is safe to mutate"""
+        first = parse_tournament_metadata_cached(self.swiss_html)
+        first["stages"].append({"type": "bogus"})
+        second = parse_tournament_metadata_cached(self.swiss_html)
+
+        self.assertEqual(second, self.swiss_metadata)
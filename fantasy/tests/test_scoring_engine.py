@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from django.test import SimpleTestCase
 from fantasy.utils.scoring_engine import (
     resolve_path,
@@ -6,6 +8,7 @@ from fantasy.utils.scoring_engine import (
     eval_condition,
     eval_scoring,
     evaluate_rules,
+    compile_rules,
     execute_scoring_config,
     AmbiguousRuleError,
     ObjectNotFoundError,
@@ -157,12 +160,12 @@ class OperatorsTest(SimpleTestCase):
 class WorkflowTest(SimpleTestCase):
     def setUp(self):
         # Create mock objects with pk attribute for scoring engine
-        pred1 = type('Prediction', (), {'pk': 1, 'id': 1, 'score': 3})()
-        pred2 = type('Prediction', (), {'pk': 2, 'id': 2, 'score': 1})()
-        res1 = type('Result', (), {'id': 1, 'score': 3})()
-        res2 = type('Result', (), {'id': 2, 'score': 2})()
-        mvp_pred = type('MVPPred', (), {'pk': 10, 'type': 'mvp', 'name': 'PlayerX'})()
-        awards_res = type('AwardsRes', (), {'type': 'awards', 'mvp': type('MVP', (), {'name': 'PlayerX'})()})()
+        pred1 = SimpleNamespace(pk=1, id=1, score=3)
+        pred2 = SimpleNamespace(pk=2, id=2, score=1)
+        res1 = SimpleNamespace(id=1, score=3)
+        res2 = SimpleNamespace(id=2, score=2)
+        mvp_pred = SimpleNamespace(pk=10, type='mvp', name='PlayerX')
+        awards_res = SimpleNamespace(type='awards', mvp=SimpleNamespace(name='PlayerX'))
 
         self.data_context = {
             "swiss_preds": [pred1, pred2],
@@ -181,7 +184,7 @@ class WorkflowTest(SimpleTestCase):
                 "scoring": {"operator": "fixed", "value": 10},
             }
         ]
-        pred = type('Prediction', (), {'pk': 1, 'score': 5})()
+        pred = SimpleNamespace(pk=1, score=5)
         res = {"score": 5}
         result = evaluate_rules(rules, pred, res)
 
@@ -207,7 +210,7 @@ class WorkflowTest(SimpleTestCase):
                 "scoring": {"operator": "fixed", "value": 5},
             }
         ]
-        pred = type('Prediction', (), {'pk': 1})()
+        pred = SimpleNamespace(pk=1)
         res = {}
         result = evaluate_rules(rules, pred, res)
 
@@ -216,6 +219,27 @@ class WorkflowTest(SimpleTestCase):
         self.assertEqual(len(result.breakdown), 1)
         self.assertEqual(result.breakdown[0].rule_id, "first_rule")
 
+    def test_compile_rules(self):
+        """Test compiled rules score the same as raw rules and compile only once."""
+        rules = [
+            {
+                "id": "test_rule",
+                "condition": {"operator": "eq", "source": "prediction.score", "target": "result.score"},
+                "scoring": {"operator": "fixed", "value": 10},
+            },
+            {"scoring": {"operator": "fixed", "value": 1}},
+        ]
+        compiled = compile_rules(rules)
+        self.assertIs(compile_rules(compiled), compiled)
+
+        pred = SimpleNamespace(pk=1, score=5)
+        for res, expected in [({"score": 5}, 11), ({"score": 4}, 1)]:
+            raw_result = evaluate_rules(rules, pred, res)
+            compiled_result = evaluate_rules(compiled, pred, res)
+            self.assertEqual(compiled_result, raw_result)
+            self.assertEqual(compiled_result.total_score, expected)
+        self.assertEqual(compiled_result.breakdown[0].rule_id, "untitled_rule")
+
     def test_execute_scoring_config_group_mode(self):
         config = {
             "source": {"from": "swiss_preds"},
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from django.test import SimpleTestCase
 from fantasy.utils.scoring_schema import (
     validate_scoring_config,
@@ -294,8 +296,8 @@ class ScoringSchemaValidationTest(SimpleTestCase):
     def test_format_validation_errors(self):
         """Test error formatting function."""
         errors = [
-            type('Error', (), {'path': 'rules[0].id', 'message': 'Missing ID'})(),
-            type('Error', (), {'path': '', 'message': 'Invalid config'})(),
+            SimpleNamespace(path='rules[0].id', message='Missing ID'),
+            SimpleNamespace(path='', message='Invalid config'),
         ]
         formatted = format_validation_errors(errors)
         self.assertIn("rules[0].id", formatted)
@@ -1,10 +1,10 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 from fantasy.models.stat_predictions import get_default_stat_scoring_config
 from fantasy.utils.scoring_schema import validate_scoring_config
 from fantasy.utils.scoring_engine import evaluate_rules
 
 
-class StatPredictionsScoringConfigTest(TestCase):
+class StatPredictionsScoringConfigTest(SimpleTestCase):
     """Tests for StatPredictions module default scoring configuration."""
 
     def test_default_stat_scoring_config_valid(self):
@@ -26,7 +26,7 @@ class StatPredictionsScoringConfigTest(TestCase):
         self.assertIn("player_is_top_3", rule_ids)
 
 
-class StatPredictionsScoringLogicTest(TestCase):
+class StatPredictionsScoringLogicTest(SimpleTestCase):
     """Tests for StatPredictions scoring logic with actual prediction/result data."""
 
     def setUp(self):
@@ -1,10 +1,10 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 from fantasy.models.swiss import get_default_swiss_scoring_config
 from fantasy.utils.scoring_schema import validate_scoring_config
 from fantasy.utils.scoring_engine import evaluate_rules
 
 
-class SwissScoringConfigTest(TestCase):
+class SwissScoringConfigTest(SimpleTestCase):
     """Tests for Swiss module default scoring configuration."""
 
     def test_default_swiss_scoring_config_valid(self):
@@ -26,7 +26,7 @@ class SwissScoringConfigTest(TestCase):
         self.assertIn("group_match", rule_ids)
 
 
-class SwissScoringLogicTest(TestCase):
+class SwissScoringLogicTest(SimpleTestCase):
     """Tests for Swiss scoring logic with actual prediction/result data."""
 
     def setUp(self):
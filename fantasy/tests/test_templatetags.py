@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from fantasy.models import Stage, Tournament
+from fantasy.templatetags import fantasy_tags
+from fantasy.utils.colors import interpolate_color
+
+_GRADIENT_TEMPLATE = Template(
+    "{% load fantasy_tags %}"
+    "{% gradient_color value '#000000' '#FFFFFF' items attr %}"
+)
+
+
+def _render_gradient(value, items, attr="order"):
+    return _GRADIENT_TEMPLATE.render(
+        Context({"value": value, "items": items, "attr": attr})
+    )
+
+
+class GradientColorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.tournament = Tournament.objects.create(
+            name="Test Tournament", start_date=now, end_date=now
+        )
+        for order in (0, 5, 10):
+            Stage.objects.create(
+                tournament=cls.tournament, name=f"Stage {order}", order=order
+            )
+
+    def test_queryset_aggregates_bounds(self):
+        with self.assertNumQueries(1):
+            color = _render_gradient(5, Stage.objects.all())
+        self.assertEqual(color, interpolate_color("#000000", "#FFFFFF", 0.5))
+
+    def test_empty_queryset(self):
+        self.assertEqual(_render_gradient(5, Stage.objects.none()), "#000000")
+        self.assertEqual(
+            _render_gradient(5, Stage.objects.filter(pk__in=[])), "#000000"
+        )
+
+    def test_list_input(self):
+        items = [SimpleNamespace(order=order) for order in (0, 4)]
+        self.assertEqual(
+            _render_gradient(1, items), interpolate_color("#000000", "#FFFFFF", 0.25)
+        )
+
+    def test_evaluated_queryset_is_not_queried_again(self):
+        stages = Stage.objects.all()
+        list(stages)
+        with self.assertNumQueries(0):
+            color = _render_gradient(10, stages)
+        self.assertEqual(color, "#FFFFFF")
+
+    def test_non_field_attribute_falls_back_to_python(self):
+        with patch.object(
+            Stage, "weight", property(lambda stage: stage.order * 2), create=True
+        ):
+            color = _render_gradient(10, Stage.objects.all(), attr="weight")
+        self.assertEqual(color, interpolate_color("#000000", "#FFFFFF", 0.5))
+
+
+class DynamicIncludeTest(SimpleTestCase):
+    template = Template(
+        "{% load fantasy_tags %}{% dynamic_include 'included.html' keys %}"
+    )
+
+    def setUp(self):
+        patcher = patch.object(fantasy_tags, "get_template")
+        self.mock_get_template = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_get_template.return_value.render.return_value = "rendered"
+
+    def tearDown(self):
+        fantasy_tags._get_template_cached.cache_clear()
+
+    def _render_twice(self):
+        for _ in range(2):
+            output = self.template.render(Context({"keys": {"a": 1}}))
+            self.assertEqual(output, "rendered")
+
+    @override_settings(DEBUG=False)
+    def test_template_is_loaded_once(self):
+        self._render_twice()
+        self.mock_get_template.assert_called_once_with("included.html")
+
+    @override_settings(DEBUG=True)
+    def test_debug_bypasses_cache(self):
+        self._render_twice()
+        self.assertEqual(self.mock_get_template.call_count, 2)
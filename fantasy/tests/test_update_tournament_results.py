@@ -28,51 +28,52 @@ from fantasy.tasks.update_results import update_tournament_results_task
 class UpdateTournamentResultsCommandTest(TestCase):
     """Tests for the update_tournament_results management command."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up a tournament with ongoing modules."""
         # Create tournament
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name="Test Tournament",
             start_date=timezone.now() - timezone.timedelta(days=5),
             end_date=timezone.now() + timezone.timedelta(days=5),
             hltv_url="http://fake-hltv-url.com/event/123",
         )
 
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
+        cls.stage = Stage.objects.create(
+            tournament=cls.tournament,
             name="Test Stage",
             order=1,
         )
 
         # Create teams
-        self.team1 = Team.objects.create(name="Team 1", hltv_id=1001)
-        self.team2 = Team.objects.create(name="Team 2", hltv_id=1002)
+        cls.team1 = Team.objects.create(name="Team 1", hltv_id=1001)
+        cls.team2 = Team.objects.create(name="Team 2", hltv_id=1002)
 
         # Create Swiss module (ongoing)
-        self.swiss_module = SwissModule.objects.create(
+        cls.swiss_module = SwissModule.objects.create(
             name="Swiss Stage",
-            tournament=self.tournament,
-            stage=self.stage,
+            tournament=cls.tournament,
+            stage=cls.stage,
             start_date=timezone.now() - timezone.timedelta(days=2),
             end_date=timezone.now() + timezone.timedelta(days=2),
             prediction_deadline=timezone.now() - timezone.timedelta(hours=1),
             is_completed=False,
         )
-        self.swiss_module.teams.set([self.team1, self.team2])
+        cls.swiss_module.teams.set([cls.team1, cls.team2])
 
         # Create Swiss scores
         qualified_group, _ = SwissScoreGroup.objects.get_or_create(name="Qualified")
         score_3_0, _ = SwissScore.objects.get_or_create(wins=3, losses=0)
         score_3_0.groups.set([qualified_group])
 
-        self.swiss_module_score_3_0 = SwissModuleScore.objects.create(
-            module=self.swiss_module,
+        cls.swiss_module_score_3_0 = SwissModuleScore.objects.create(
+            module=cls.swiss_module,
             score=score_3_0,
             limit_per_user=3
         )
 
         # Create a user for scoring
-        self.user = User.objects.create_user(username="testuser", email="test@test.com")
+        cls.user = User.objects.create_user(username="testuser", email="test@test.com")
 
     def test_command_with_invalid_tournament_id(self):
         """Test command fails gracefully with invalid tournament ID."""
@@ -255,38 +256,39 @@ class UpdateTournamentResultsCommandTest(TestCase):
 class UpdateTournamentResultsBracketTest(TestCase):
     """Tests for bracket module updates."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up tournament with bracket module."""
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name="Test Tournament",
             start_date=timezone.now() - timezone.timedelta(days=5),
             end_date=timezone.now() + timezone.timedelta(days=5),
             hltv_url="http://fake-hltv-url.com/event/123",
         )
 
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
+        cls.stage = Stage.objects.create(
+            tournament=cls.tournament,
             name="Playoffs",
             order=1,
         )
 
-        self.team1 = Team.objects.create(name="Team 1", hltv_id=1001)
-        self.team2 = Team.objects.create(name="Team 2", hltv_id=1002)
+        cls.team1 = Team.objects.create(name="Team 1", hltv_id=1001)
+        cls.team2 = Team.objects.create(name="Team 2", hltv_id=1002)
 
-        self.bracket = Bracket.objects.create(
+        cls.bracket = Bracket.objects.create(
             name="Playoff Bracket",
-            tournament=self.tournament,
-            stage=self.stage,
+            tournament=cls.tournament,
+            stage=cls.stage,
             start_date=timezone.now() - timezone.timedelta(days=2),
             end_date=timezone.now() + timezone.timedelta(days=2),
             prediction_deadline=timezone.now() - timezone.timedelta(hours=1),
             is_completed=False,
         )
 
-        self.match = BracketMatch.objects.create(
-            bracket=self.bracket,
-            team_a=self.team1,
-            team_b=self.team2,
+        cls.match = BracketMatch.objects.create(
+            bracket=cls.bracket,
+            team_a=cls.team1,
+            team_b=cls.team2,
             hltv_match_id=5001,
             round=1,
             best_of=3,
@@ -333,38 +335,39 @@ class UpdateTournamentResultsBracketTest(TestCase):
 class UpdateTournamentResultsStatPredictionsTest(TestCase):
     """Tests for stat predictions module updates."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up tournament with stat predictions module."""
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name="Test Tournament",
             start_date=timezone.now() - timezone.timedelta(days=5),
             end_date=timezone.now() + timezone.timedelta(days=5),
             hltv_url="http://fake-hltv-url.com/event/123",
         )
 
-        self.stage = Stage.objects.create(
-            tournament=self.tournament,
+        cls.stage = Stage.objects.create(
+            tournament=cls.tournament,
             name="Stats Stage",
             order=1,
         )
 
-        self.stat_module = StatPredictionsModule.objects.create(
+        cls.stat_module = StatPredictionsModule.objects.create(
             name="Player Stats",
-            tournament=self.tournament,
-            stage=self.stage,
+            tournament=cls.tournament,
+            stage=cls.stage,
             start_date=timezone.now() - timezone.timedelta(days=2),
             end_date=timezone.now() + timezone.timedelta(days=2),
             prediction_deadline=timezone.now() - timezone.timedelta(hours=1),
             is_completed=False,
         )
 
-        self.category = StatPredictionCategory.objects.create(
+        cls.category = StatPredictionCategory.objects.create(
             name="Top Players",
         )
 
-        self.definition = StatPredictionDefinition.objects.create(
-            module=self.stat_module,
-            category=self.category,
+        cls.definition = StatPredictionDefinition.objects.create(
+            module=cls.stat_module,
+            category=cls.category,
             title="MVP",
             source_url="http://fake-hltv.com/stats/mvp",
         )
@@ -421,30 +424,27 @@ class UpdateTournamentResultsStatPredictionsTest(TestCase):
 class UpdateTournamentResultsTaskTest(TestCase):
     """Tests for the Django-Q task wrapper."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up tournament."""
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name="Test Tournament",
             start_date=timezone.now(),
             end_date=timezone.now() + timezone.timedelta(days=5),
             hltv_url="http://fake-hltv-url.com/event/123",
         )
 
-    @patch('fantasy.tasks.update_results.call_command')
-    def test_task_wrapper_calls_command(self, mock_call_command):
-        """Test task wrapper calls the management command correctly."""
+    @patch('fantasy.tasks.update_results.update_tournament_results')
+    def test_task_wrapper_calls_command(self, mock_update):
+        """Test task wrapper runs the command logic for the tournament."""
         update_tournament_results_task(self.tournament.id)
 
-        mock_call_command.assert_called_once_with(
-            'update_tournament_results',
-            self.tournament.id,
-            verbosity=2
-        )
+        mock_update.assert_called_once_with(self.tournament.id)
 
-    @patch('fantasy.tasks.update_results.call_command')
-    def test_task_wrapper_handles_exceptions(self, mock_call_command):
+    @patch('fantasy.tasks.update_results.update_tournament_results')
+    def test_task_wrapper_handles_exceptions(self, mock_update):
         """Test task wrapper propagates exceptions."""
-        mock_call_command.side_effect = Exception("Command failed")
+        mock_update.side_effect = Exception("Command failed")
 
         with self.assertRaises(Exception):
             update_tournament_results_task(self.tournament.id)
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color (e.g., '#FF00AA') to RGB tuple."""
     hex_color = hex_color.lstrip("#")
@@ -67,3 +70,18 @@ def interpolate_color(start_hex: str, end_hex: str, factor: float) -> str:
     b = round(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * factor)
 
     return rgb_to_hex((r, g, b))
+
+
+@lru_cache(maxsize=4096)
+def _interpolate_color_cached(start_hex: str, end_hex: str, factor: float) -> str:
+    return interpolate_color(start_hex, end_hex, factor)
+
+
+def interpolate_color_cached(start_hex: str, end_hex: str, factor: float) -> str:
+    """
+    Memoized interpolate_color for hot template paths.
+
+    The factor is rounded to 3 decimals so repeated renders hit the cache;
+    that is finer than the 8-bit channel resolution in practice.
+    """
+    return _interpolate_color_cached(start_hex, end_hex, round(factor, 3))
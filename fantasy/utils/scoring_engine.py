@@ -13,8 +13,10 @@ Architecture Overview:
    object and a data context, handles data selection (`where` clauses) and
    pairing (`join_on`), and calls `evaluate_rules` for each pair.
 2. `evaluate_rules`: Applies a list of rules to a single prediction/result pair.
-3. `eval_condition`: Evaluates a rule's `condition` block and returns a bool.
-4. `eval_scoring`: Evaluates a rule's `scoring` block and returns a number.
+3. `compile_rules`: Turns each rule's `condition` and `scoring` blocks into
+   callables once, so paths and operators aren't re-parsed for every pair.
+4. `eval_condition`: Evaluates a rule's `condition` block and returns a bool.
+5. `eval_scoring`: Evaluates a rule's `scoring` block and returns a number.
 
 ---
 Future Enhancement Consideration:
@@ -28,11 +30,12 @@ to `evaluate_rules` contains the necessary context (like `definition_id`).
 """
 
 import functools
+import sys
 from dataclasses import dataclass
-from typing import List, Any
+from typing import Any, Callable, List, NamedTuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdownItem:
     """Represents a single scoring event."""
 
@@ -42,7 +45,7 @@ class ScoreBreakdownItem:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Structured result of a rule evaluation."""
 
@@ -113,33 +116,78 @@ class SchemaValidationError(ScoringEngineError):
     pass
 
 
+def _resolve_nothing(*args):
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _path_resolver(path):
+    """Builds (and caches) the resolver for a dot-separated path string."""
+    keys = tuple(path.split("."))
+
+    def resolve(obj):
+        try:
+            for key in keys:
+                obj = obj.get(key) if isinstance(obj, dict) else getattr(obj, key)
+            return obj
+        except (AttributeError, KeyError):
+            return None
+
+    return resolve
+
+
+def _compile_path(path):
+    """
+    Returns a resolver equivalent to `lambda obj: resolve_path(obj, path)`.
+    Paths are split once and the resolver is shared across calls.
+    """
+    if not isinstance(path, str):
+        return _resolve_nothing
+    return _path_resolver(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _context_path_resolver(path):
+    """Builds (and caches) the (prediction, result) resolver for a path string."""
+    root, _, rest = path.partition(".")
+    resolve_rest = _path_resolver(rest) if rest else (lambda obj: obj)
+
+    if root == "prediction":
+        return lambda prediction, result: resolve_rest(prediction)
+    if root == "result":
+        return lambda prediction, result: resolve_rest(result)
+    return _resolve_nothing
+
+
+def _compile_context_path(path):
+    """
+    Compiles a "prediction.x" / "result.y" path into a resolver taking
+    (prediction, result), so no context dict is built per evaluation.
+    """
+    if not isinstance(path, str):
+        return _resolve_nothing
+    return _context_path_resolver(path)
+
+
 def resolve_path(obj, path):
     """
     Resolves a dot-separated path on an object, supporting both attribute and dict key access.
     e.g., resolve_path(prediction, '''team.name''')
     """
-    try:
-        return functools.reduce(
-            lambda acc, key: acc.get(key)
-            if isinstance(acc, dict)
-            else getattr(acc, key),
-            path.split("."),
-            obj,
-        )
-    except (AttributeError, KeyError):
-        return None
-
-
-def _matches_where(item, where_clause):
-    """Checks if an item matches all conditions in a where clause."""
-    if not where_clause:
-        return True
-    return all(resolve_path(item, k) == v for k, v in where_clause.items())
+    return _compile_path(path)(obj)
 
 
 def find_objects(collection, where_clause):
     """Finds all objects in a collection matching a where clause."""
-    return [item for item in collection if _matches_where(item, where_clause)]
+    if not where_clause:
+        return list(collection)
+    # Resolve each where path once, not once per item
+    checks = [(_compile_path(k), v) for k, v in where_clause.items()]
+    return [
+        item
+        for item in collection
+        if all(resolve(item) == v for resolve, v in checks)
+    ]
 
 
 def find_object(collection, where_clause):
@@ -158,7 +206,15 @@ def find_object(collection, where_clause):
     return found[0]
 
 
-def _eval_condition_eq(condition, prediction, result):
+def _never(prediction, result):
+    return False
+
+
+def _score_nothing(prediction, result):
+    return 0
+
+
+def _compile_condition_eq(condition):
     """
     Evaluates if two values are equal.
 
@@ -169,13 +225,17 @@ def _eval_condition_eq(condition, prediction, result):
         "target": "path.to.result.value"       # Path to a value in prediction/result context
     }
     """
-    context = {"prediction": prediction, "result": result}
-    source_val = resolve_path(context, condition["source"])
-    target_val = resolve_path(context, condition["target"])
-    return source_val is not None and source_val == target_val
+    get_source = _compile_context_path(condition["source"])
+    get_target = _compile_context_path(condition["target"])
 
+    def evaluate(prediction, result):
+        source_val = get_source(prediction, result)
+        return source_val is not None and source_val == get_target(prediction, result)
 
-def _eval_condition_always_true(condition, prediction, result):
+    return evaluate
+
+
+def _compile_condition_always_true(condition):
     """
     Always returns True, effectively making the rule unconditional.
 
@@ -184,10 +244,10 @@ def _eval_condition_always_true(condition, prediction, result):
         "operator": "always_true"
     }
     """
-    return True
+    return lambda prediction, result: True
 
 
-def _eval_condition_in_list(condition, prediction, result):
+def _compile_condition_in_list(condition):
     """
     Checks if a source value exists within a target list.
 
@@ -199,21 +259,26 @@ def _eval_condition_in_list(condition, prediction, result):
         "list_item_key": "key_in_list_object"  # Optional: If target_list contains objects, key to check
     }
     """
-    context = {"prediction": prediction, "result": result}
-    source_val = resolve_path(context, condition["source"])
-    target_list = resolve_path(context, condition["target_list"])
+    get_source = _compile_context_path(condition["source"])
+    get_target_list = _compile_context_path(condition["target_list"])
+    key = condition.get("list_item_key")
+    get_item_key = _compile_path(key) if key else None
 
-    if source_val is None or not isinstance(target_list, list):
-        return False
+    def evaluate(prediction, result):
+        source_val = get_source(prediction, result)
+        target_list = get_target_list(prediction, result)
 
-    key = condition.get("list_item_key")
-    if key:
-        return any(resolve_path(item, key) == source_val for item in target_list)
-    else:
+        if source_val is None or not isinstance(target_list, list):
+            return False
+
+        if get_item_key:
+            return any(get_item_key(item) == source_val for item in target_list)
         return source_val in target_list
 
+    return evaluate
+
 
-def _eval_condition_in_list_within_top_x(condition, prediction, result):
+def _compile_condition_in_list_within_top_x(condition):
     """
     Checks if a source value is in a list and its item's position is within a top_x threshold.
 
@@ -227,33 +292,39 @@ def _eval_condition_in_list_within_top_x(condition, prediction, result):
         "top_x": 5                             # The rank threshold (inclusive)
     }
     """
-    context = {"prediction": prediction, "result": result}
-    source_val = resolve_path(context, condition["source"])
-    target_list = resolve_path(context, condition["target_list"])
     list_item_key = condition.get("list_item_key")
     position_key = condition.get("position_key")
     top_x = condition.get("top_x")
 
-    if (
-        source_val is None
-        or not isinstance(target_list, list)
-        or not all([list_item_key, position_key, top_x is not None])
-    ):
-        return False
-
-    for item in target_list:
-        item_val = resolve_path(item, list_item_key)
-        if item_val == source_val:
-            position = resolve_path(item, position_key)
-            if position is not None and isinstance(position, int) and position <= top_x:
-                return True
-            # Found the item but position condition not met, no need to check further
+    if not all([list_item_key, position_key, top_x is not None]):
+        return _never
+
+    get_source = _compile_context_path(condition["source"])
+    get_target_list = _compile_context_path(condition["target_list"])
+    get_item_key = _compile_path(list_item_key)
+    get_position = _compile_path(position_key)
+
+    def evaluate(prediction, result):
+        source_val = get_source(prediction, result)
+        target_list = get_target_list(prediction, result)
+
+        if source_val is None or not isinstance(target_list, list):
             return False
 
-    return False  # Item not found in list
+        for item in target_list:
+            if get_item_key(item) == source_val:
+                position = get_position(item)
+                if position is not None and isinstance(position, int) and position <= top_x:
+                    return True
+                # Found the item but position condition not met, no need to check further
+                return False
+
+        return False  # Item not found in list
 
+    return evaluate
 
-def _eval_condition_list_intersects(condition, prediction, result):
+
+def _compile_condition_list_intersects(condition):
     """
     Checks if two lists have any common elements. Handles Django Managers.
 
@@ -264,23 +335,28 @@ def _eval_condition_list_intersects(condition, prediction, result):
         "target_list": "path.to.list2"
     }
     """
-    context = {"prediction": prediction, "result": result}
-    list1 = resolve_path(context, condition["source_list"])
-    list2 = resolve_path(context, condition["target_list"])
+    get_list1 = _compile_context_path(condition["source_list"])
+    get_list2 = _compile_context_path(condition["target_list"])
+
+    def evaluate(prediction, result):
+        list1 = get_list1(prediction, result)
+        list2 = get_list2(prediction, result)
+
+        # Handle Django QuerySets/Managers gracefully
+        if hasattr(list1, "all"):
+            list1 = list(list1.all())
+        if hasattr(list2, "all"):
+            list2 = list(list2.all())
 
-    # Handle Django QuerySets/Managers gracefully
-    if hasattr(list1, "all"):
-        list1 = list(list1.all())
-    if hasattr(list2, "all"):
-        list2 = list(list2.all())
+        if not isinstance(list1, list) or not isinstance(list2, list):
+            return False
 
-    if not isinstance(list1, list) or not isinstance(list2, list):
-        return False
+        return bool(set(list1) & set(list2))
 
-    return bool(set(list1) & set(list2))
+    return evaluate
 
 
-def _eval_condition_and(condition, prediction, result):
+def _compile_condition_and(condition):
     """
     Evaluates multiple conditions with AND logic (all must be true).
 
@@ -295,12 +371,23 @@ def _eval_condition_and(condition, prediction, result):
     """
     conditions = condition.get("conditions", [])
     if not conditions:
-        return False
+        return _never
+
+    compiled = tuple(compile_condition(cond) for cond in conditions)
+    if len(compiled) == 1:
+        return compiled[0]
+
+    def evaluate(prediction, result):
+        # Plain loop rather than all(<genexpr>): no generator per evaluation
+        for matches in compiled:
+            if not matches(prediction, result):
+                return False
+        return True
 
-    return all(eval_condition(cond, prediction, result) for cond in conditions)
+    return evaluate
 
 
-def _eval_condition_list_contains_literal(condition, prediction, result):
+def _compile_condition_list_contains_literal(condition):
     """
     Checks if a target list contains a literal source value.
 
@@ -311,17 +398,20 @@ def _eval_condition_list_contains_literal(condition, prediction, result):
         "target_list": "path.to.list",       # Path to the list (e.g., result.tags)
     }
     """
-    context = {"prediction": prediction, "result": result}
     source_val = condition.get("source_value")
-    target_list = resolve_path(context, condition.get("target_list"))
+    if source_val is None:
+        return _never
+
+    get_target_list = _compile_context_path(condition.get("target_list"))
 
-    if source_val is None or not isinstance(target_list, list):
-        return False
+    def evaluate(prediction, result):
+        target_list = get_target_list(prediction, result)
+        return isinstance(target_list, list) and source_val in target_list
 
-    return source_val in target_list
+    return evaluate
 
 
-def _eval_condition_set_equal(condition, prediction, result):
+def _compile_condition_set_equal(condition):
     """
     Checks if two sets are equal (order-independent comparison).
 
@@ -335,52 +425,73 @@ def _eval_condition_set_equal(condition, prediction, result):
         "target_list": ["result.team_a_id", "result.team_b_id"]
     }
     """
-    context = {"prediction": prediction, "result": result}
+    source_getters = [
+        _compile_context_path(path) for path in condition.get("source_list", [])
+    ]
+    target_getters = [
+        _compile_context_path(path) for path in condition.get("target_list", [])
+    ]
+
+    if len(source_getters) == 2 and len(target_getters) == 2:
+        # Matchup fast path: compare the two pairs directly, falling back to
+        # the set comparison only when a slot is empty.
+        get_a, get_b = source_getters
+        get_c, get_d = target_getters
 
-    source_paths = condition.get("source_list", [])
-    target_paths = condition.get("target_list", [])
+        def evaluate_pair(prediction, result):
+            a = get_a(prediction, result)
+            b = get_b(prediction, result)
+            c = get_c(prediction, result)
+            d = get_d(prediction, result)
+            if a is None or b is None or c is None or d is None:
+                return ({a, b} - {None}) == ({c, d} - {None})
+            return (a == c and b == d) or (a == d and b == c)
 
-    source_values = []
-    for path in source_paths:
-        val = resolve_path(context, path)
-        if val is not None:
-            source_values.append(val)
+        return evaluate_pair
 
-    target_values = []
-    for path in target_paths:
-        val = resolve_path(context, path)
-        if val is not None:
-            target_values.append(val)
+    def evaluate(prediction, result):
+        source_values = {get(prediction, result) for get in source_getters}
+        target_values = {get(prediction, result) for get in target_getters}
+        source_values.discard(None)
+        target_values.discard(None)
 
-    # Compare as sets (order-independent)
-    return set(source_values) == set(target_values)
+        # Compare as sets (order-independent)
+        return source_values == target_values
+
+    return evaluate
 
 
 CONDITION_OPERATORS = {
-    "eq": _eval_condition_eq,
-    "always_true": _eval_condition_always_true,
-    "in_list": _eval_condition_in_list,
-    "in_list_within_top_x": _eval_condition_in_list_within_top_x,
-    "list_intersects": _eval_condition_list_intersects,
-    "and": _eval_condition_and,
-    "list_contains_literal": _eval_condition_list_contains_literal,
-    "set_equal": _eval_condition_set_equal,
+    "eq": _compile_condition_eq,
+    "always_true": _compile_condition_always_true,
+    "in_list": _compile_condition_in_list,
+    "in_list_within_top_x": _compile_condition_in_list_within_top_x,
+    "list_intersects": _compile_condition_list_intersects,
+    "and": _compile_condition_and,
+    "list_contains_literal": _compile_condition_list_contains_literal,
+    "set_equal": _compile_condition_set_equal,
 }
 
 
+def compile_condition(condition):
+    """
+    Compiles a condition block into a `(prediction, result) -> bool` callable.
+    Unknown operators compile to a condition that never matches.
+    """
+    compiler = CONDITION_OPERATORS.get(condition.get("operator"))
+    if compiler:
+        return compiler(condition)
+    return _never
+
+
 def eval_condition(condition, prediction_obj, result_obj):
     """
     Evaluates a condition from a rule. Returns a boolean.
     """
-    operator = condition.get("operator")
-    eval_func = CONDITION_OPERATORS.get(operator)
-
-    if eval_func:
-        return eval_func(condition, prediction_obj, result_obj)
-    return False
+    return compile_condition(condition)(prediction_obj, result_obj)
 
 
-def _eval_scoring_fixed(scoring, prediction_obj, result_obj):
+def _compile_scoring_fixed(scoring):
     """
     Returns a fixed score value.
 
@@ -390,10 +501,11 @@ def _eval_scoring_fixed(scoring, prediction_obj, result_obj):
         "value": 10  # The fixed score to return
     }
     """
-    return scoring.get("value", 0)
+    value = scoring.get("value", 0)
+    return lambda prediction, result: value
 
 
-def _eval_scoring_map_points(scoring, prediction_obj, result_obj):
+def _compile_scoring_map_points(scoring):
     """
     Finds a value in a list and awards points based on its index.
 
@@ -406,27 +518,35 @@ def _eval_scoring_map_points(scoring, prediction_obj, result_obj):
         "scores": [50, 30, 20]                    # Scores to award based on 0-based index
     }
     """
-    context = {"prediction": prediction_obj, "result": result_obj}
-    source_value = resolve_path(context, scoring.get("source_value"))
-    target_list = resolve_path(context, scoring.get("target_list"))
     list_item_key = scoring.get("list_item_key")
+    if not list_item_key:
+        return _score_nothing
+
+    get_source = _compile_context_path(scoring.get("source_value"))
+    get_target_list = _compile_context_path(scoring.get("target_list"))
+    get_item_key = _compile_path(list_item_key)
     scores = scoring.get("scores", [])
 
-    if source_value is None or not isinstance(target_list, list) or not list_item_key:
-        return 0
+    def evaluate(prediction, result):
+        source_value = get_source(prediction, result)
+        target_list = get_target_list(prediction, result)
 
-    for index, item in enumerate(target_list):
-        item_value = resolve_path(item, list_item_key)
-        if item_value == source_value:
-            if index < len(scores):
-                return scores[index]
-            else:
-                return 0  # Found, but no score defined for this index
+        if source_value is None or not isinstance(target_list, list):
+            return 0
+
+        for index, item in enumerate(target_list):
+            if get_item_key(item) == source_value:
+                if index < len(scores):
+                    return scores[index]
+                else:
+                    return 0  # Found, but no score defined for this index
+
+        return 0  # Not found in the list
 
-    return 0  # Not found in the list
+    return evaluate
 
 
-def _eval_scoring_scaled_difference(scoring, prediction_obj, result_obj):
+def _compile_scoring_scaled_difference(scoring):
     """
     Calculates a score based on the scaled difference between two numeric values.
 
@@ -439,38 +559,50 @@ def _eval_scoring_scaled_difference(scoring, prediction_obj, result_obj):
         "points_per_unit": -5           # Points awarded/deducted per unit of difference
     }
     """
-    context = {"prediction": prediction_obj, "result": result_obj}
-    val1 = resolve_path(context, scoring["source1"])
-    val2 = resolve_path(context, scoring["source2"])
+    get_val1 = _compile_context_path(scoring["source1"])
+    get_val2 = _compile_context_path(scoring["source2"])
     unit = scoring.get("unit")
     points_per_unit = scoring.get("points_per_unit")
 
-    if None in [val1, val2, unit, points_per_unit] or unit == 0:
-        return 0
-    if not all(isinstance(v, (int, float)) for v in [val1, val2]):
-        return 0
+    if unit is None or points_per_unit is None or unit == 0:
+        return _score_nothing
 
-    difference = abs(val1 - val2)
-    return (difference // unit) * points_per_unit
+    def evaluate(prediction, result):
+        val1 = get_val1(prediction, result)
+        val2 = get_val2(prediction, result)
+
+        if not all(isinstance(v, (int, float)) for v in [val1, val2]):
+            return 0
+
+        difference = abs(val1 - val2)
+        return (difference // unit) * points_per_unit
+
+    return evaluate
 
 
 SCORING_OPERATORS = {
-    "fixed": _eval_scoring_fixed,
-    "map_points": _eval_scoring_map_points,
-    "scaled_difference": _eval_scoring_scaled_difference,
+    "fixed": _compile_scoring_fixed,
+    "map_points": _compile_scoring_map_points,
+    "scaled_difference": _compile_scoring_scaled_difference,
 }
 
 
+def compile_scoring(scoring):
+    """
+    Compiles a scoring block into a `(prediction, result) -> number` callable.
+    Unknown operators compile to a scorer that always returns 0.
+    """
+    compiler = SCORING_OPERATORS.get(scoring.get("operator"))
+    if compiler:
+        return compiler(scoring)
+    return _score_nothing
+
+
 def eval_scoring(scoring, prediction_obj, result_obj):
     """
     Calculates a score based on an operator.
     """
-    operator = scoring.get("operator")
-    eval_func = SCORING_OPERATORS.get(operator)
-
-    if eval_func:
-        return eval_func(scoring, prediction_obj, result_obj)
-    return 0
+    return compile_scoring(scoring)(prediction_obj, result_obj)
 
 
 def validate_rule(rule):
@@ -496,41 +628,95 @@ def validate_rule(rule):
     return True
 
 
+class CompiledRule(NamedTuple):
+    """
+    A rule with its condition and scoring blocks compiled to callables.
+    A tuple so `evaluate_rules` can unpack it straight into locals.
+    """
+
+    matches: Callable[[Any, Any], bool]
+    score: Callable[[Any, Any], Any]
+    rule_id: str
+    description: str
+    exclusive: bool
+
+
+class CompiledRules(tuple):
+    """Tuple of CompiledRule, as returned by compile_rules."""
+
+    __slots__ = ()
+
+
+def _always_matches(prediction, result):
+    return True
+
+
+def compile_rules(rules) -> CompiledRules:
+    """
+    Compiles a list of rules once so they can be evaluated against many
+    prediction/result pairs without re-walking the rule dicts.
+    Already compiled rules are returned as-is.
+    """
+    if isinstance(rules, CompiledRules):
+        return rules
+
+    compiled = []
+    for rule in rules:
+        rule_id = rule.get("id", "untitled_rule")
+        if isinstance(rule_id, str):
+            # Ids loaded from JSON aren't interned; every breakdown item of
+            # this rule shares the one string object.
+            rule_id = sys.intern(rule_id)
+
+        compiled.append(
+            CompiledRule(
+                matches=(
+                    compile_condition(rule["condition"])
+                    if "condition" in rule
+                    else _always_matches
+                ),
+                score=compile_scoring(rule["scoring"]),
+                rule_id=rule_id,
+                description=rule.get("description", "Points awarded for matching rule."),
+                exclusive=rule.get("exclusive", False),
+            )
+        )
+    return CompiledRules(compiled)
+
+
 def evaluate_rules(
     rules, prediction_obj, result_obj, handler="sum"
 ) -> EvaluationResult:
     """
     Evaluates a set of rules against a prediction and a result, then
     aggregates the scores and provides a detailed breakdown.
+
+    `rules` may be a raw rule list or the output of `compile_rules`; callers
+    scoring many pairs against the same rules should compile them once.
     """
-    scores = []
+    total_score = 0
     breakdown_items = []
-    for rule in rules:
-        is_match = (
-            True
-            if "condition" not in rule
-            else eval_condition(rule["condition"], prediction_obj, result_obj)
-        )
-
-        if is_match:
-            score = eval_scoring(rule["scoring"], prediction_obj, result_obj)
-            scores.append(score)
-
-            breakdown_items.append(
-                ScoreBreakdownItem(
-                    prediction_pk=prediction_obj.pk,
-                    rule_id=rule.get("id", "untitled_rule"),
-                    points=score,
-                    description=rule.get(
-                        "description", "Points awarded for matching rule."
-                    ),
-                )
+    for matches, score_fn, rule_id, description, exclusive in compile_rules(rules):
+        if not matches(prediction_obj, result_obj):
+            continue
+
+        score = score_fn(prediction_obj, result_obj)
+        total_score += score
+        breakdown_items.append(
+            ScoreBreakdownItem(
+                prediction_pk=prediction_obj.pk,
+                rule_id=rule_id,
+                points=score,
+                description=description,
             )
+        )
 
-            if rule.get("exclusive", False):
-                break
+        # Exclusive rules stop evaluation at the first match
+        if exclusive:
+            break
 
-    total_score = sum(scores) if handler == "sum" else 0
+    if handler != "sum":
+        total_score = 0
     return EvaluationResult(total_score=total_score, breakdown=breakdown_items)
 
 
@@ -607,16 +793,16 @@ def execute_scoring_config(config, data_context):
         source_items = find_objects(source_collection, source_conf.get("where"))
         target_items = find_objects(target_collection, target_conf.get("where"))
 
-        target_map = {
-            resolve_path(item, join_on["target_key"]): item for item in target_items
-        }
+        resolve_target_key = _compile_path(join_on["target_key"])
+        target_map = {resolve_target_key(item): item for item in target_items}
 
+        rules = compile_rules(config["rules"])
+        resolve_source_key = _compile_path(join_on["source_key"])
         total_score = 0
         for s_item in source_items:
-            key_val = resolve_path(s_item, join_on["source_key"])
-            t_item = target_map.get(key_val)
+            t_item = target_map.get(resolve_source_key(s_item))
             if t_item:
-                result = evaluate_rules(config["rules"], s_item, t_item)
+                result = evaluate_rules(rules, s_item, t_item)
                 total_score += result.total_score
         return total_score
 
@@ -1,21 +1,82 @@
-from typing import Dict, List, Tuple, TypeVar
+import heapq
+from typing import Dict, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# Above this many columns the differencing method's bookkeeping outweighs
+# its quality gain over the greedy fill.
+LDM_MAX_COLUMNS = 4
+
+
+class BalancedColumns(list):
+    """
+    List of balanced columns, as returned by balance_groups.
+
+    Also carries `loads`, the total item count per column, so callers don't
+    have to re-sum the columns.
+    """
+
+    __slots__ = ("loads",)
+
+    def __init__(self, columns, loads):
+        super().__init__(columns)
+        self.loads = tuple(loads)
+
+
+def _ldm_partition(sizes: List[int], k: int) -> List[Tuple[int, ...]]:
+    """
+    Partition `sizes` into `k` subsets using the Largest Differencing Method
+    (multi-way Karmarkar-Karp).
+    Returns `k` tuples of indices into `sizes`, heaviest subset first.
+    """
+    # Each heap entry is a partial k-way partition: a list of (sum, indices)
+    # sorted by sum descending, keyed on its spread (max sum - min sum).
+    heap = []
+    for i, size in enumerate(sizes):
+        subsets = [(size, (i,))] + [(0, ())] * (k - 1)
+        heap.append((-size, i, subsets))
+    heapq.heapify(heap)
+
+    counter = len(sizes)
+    while len(heap) > 1:
+        _, _, a = heapq.heappop(heap)
+        _, _, b = heapq.heappop(heap)
+        # Pair the heaviest subsets of one with the lightest of the other
+        merged = [
+            (a[i][0] + b[k - 1 - i][0], a[i][1] + b[k - 1 - i][1]) for i in range(k)
+        ]
+        merged.sort(key=lambda s: s[0], reverse=True)
+        heapq.heappush(heap, (merged[-1][0] - merged[0][0], counter, merged))
+        counter += 1
+
+    if not heap:
+        return [()] * k
+    return [tuple(sorted(indices)) for _, indices in heap[0][2]]
+
 
 def balance_groups(
     groups: Dict[str, List[T]],
     n_columns: int = 2,
     split_groups: bool = True,
     reverse: bool = False,
-) -> List[List[Tuple[str, List[T], bool]]]:
+    algorithm: Optional[str] = None,
+) -> BalancedColumns:
     """
     Balance grouped items across N columns.
     Optionally splits groups that are evenly divisible by the number of columns.
     `reverse` flag moves split groups to the bottom.
+    `algorithm` selects how non-splittable groups are distributed: "ldm"
+    (largest differencing) or "greedy" (largest group to the lightest column).
+    Defaults to "ldm" for up to LDM_MAX_COLUMNS columns, "greedy" otherwise.
     Returns a list of columns, where each column contains tuples of
-    (group_name, items, is_split_flag).
+    (group_name, items, is_split_flag). Per-column item counts are
+    available as `.loads`.
     """
+    if algorithm is None:
+        algorithm = "ldm" if n_columns <= LDM_MAX_COLUMNS else "greedy"
+    if algorithm not in ("ldm", "greedy"):
+        raise ValueError(f"Unknown balancing algorithm: {algorithm!r}")
+
     columns: List[List[Tuple[str, List[T], bool]]] = [[] for _ in range(n_columns)]
     column_loads = [0] * n_columns
 
@@ -35,10 +96,25 @@ def balance_groups(
     def balance_main_groups():
         """Sorts and balances the non-splittable groups."""
         groups_to_balance.sort(key=lambda g: len(g[1]), reverse=True)
+        if algorithm == "ldm":
+            subsets = _ldm_partition([len(items) for _, items in groups_to_balance], n_columns)
+            # Heaviest subset goes to the lightest column, ties to the leftmost
+            targets = sorted(range(n_columns), key=lambda i: column_loads[i])
+            for col_idx, indices in zip(targets, subsets):
+                for idx in indices:
+                    name, items = groups_to_balance[idx]
+                    columns[col_idx].append((name, items, False))
+                    column_loads[col_idx] += len(items)
+            return
+
+        # Min-heap of (load, column index); ties go to the leftmost column.
+        heap = [(load, i) for i, load in enumerate(column_loads)]
+        heapq.heapify(heap)
         for name, items in groups_to_balance:
-            min_load_idx = column_loads.index(min(column_loads))
+            load, min_load_idx = heap[0]
             columns[min_load_idx].append((name, items, False))
-            column_loads[min_load_idx] += len(items)
+            column_loads[min_load_idx] = load + len(items)
+            heapq.heapreplace(heap, (column_loads[min_load_idx], min_load_idx))
 
     def add_split_groups():
         """Adds the evenly split groups to the columns."""
@@ -59,7 +135,7 @@ def balance_groups(
         add_split_groups()
         balance_main_groups()
 
-    return columns
+    return BalancedColumns(columns, column_loads)
 
 
 def print_balanced_columns(